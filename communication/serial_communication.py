@@ -47,7 +47,7 @@ from typing import List, Dict, Any, Optional, Deque
 import logging
 from collections import deque
 
-from PyQt5.QtCore import QObject, QThread, pyqtSignal, QTimer, QMutex, QMutexLocker
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, QTimer
 
 from system.custom_exceptions import (
     SerialPortException, 
@@ -57,13 +57,25 @@ from system.error_handling import retry_with_backoff, CircuitBreaker
 
 logger = logging.getLogger("CrazySerialTerm.SerialManager")
 
+# Suffixes de fin de ligne déjà encodés (ajoutés aux octets, sans chaîne intermédiaire)
+_EOL_BYTES: Dict[str, bytes] = {
+    'NL': b'\n',
+    'CR': b'\r',
+    'NL+CR': b'\r\n',
+}
+
 class SerialReaderThread(QThread):
     """Thread de lecture série robuste avec gestion d'erreurs avancée."""
     
-    data_received = pyqtSignal(bytes)
+    # Octets reçus (bytes) : déclaré object pour que PyQt transmette la référence
+    # Python telle quelle à travers la connexion en file, sans conversion ni copie
+    data_received = pyqtSignal(object)
     error_occurred = pyqtSignal(str)
     connection_lost = pyqtSignal()
     
+    # Taille maximale d'une lecture (octets émis en un seul signal)
+    MAX_READ_SIZE = 64 * 1024
+    
     def __init__(self, serial_port: Optional[serial.Serial]) -> None:
         """
         Initialise le thread de lecture série.
@@ -95,54 +107,79 @@ class SerialReaderThread(QThread):
                     if not self.serial_port or not self.serial_port.is_open:
                         logger.warning("Port série fermé, arrêt du thread")
                         break
-                    # Lecture non-bloquante avec timeout
-                    if self.serial_port.in_waiting > 0:
-                        data: bytes = self.serial_port.read(min(self.serial_port.in_waiting, 4096))
+                    waiting: int = self.serial_port.in_waiting
+                    if waiting > 0:
+                        # Tout ce qui est déjà reçu part en un seul signal
+                        data: bytes = self.serial_port.read(min(waiting, self.MAX_READ_SIZE))
+                    elif self.serial_port.timeout:
+                        # Rien en attente : lecture bloquante bornée par le timeout du port
+                        # (réveil dès le premier octet, sans boucle de scrutation), puis
+                        # récupération de ce qui est arrivé avec lui
+                        data = self.serial_port.read(1)
                         if data:
-                            self.data_received.emit(data)
-                            consecutive_errors = 0  # Reset en cas de succès
+                            waiting = self.serial_port.in_waiting
+                            if waiting:
+                                data += self.serial_port.read(min(waiting, self.MAX_READ_SIZE))
                     else:
-                        # Petite pause pour éviter la surcharge CPU
+                        # Port non bloquant : petite pause pour éviter la surcharge CPU
                         self.msleep(10)
+                        continue
+                    if data:
+                        self.data_received.emit(data)
+                        consecutive_errors = 0  # Reset en cas de succès
                 except (serial.SerialException, OSError, IOError, PermissionError) as e:
                     consecutive_errors += 1
                     # Détection spécifique des déconnexions USB
                     if isinstance(e, PermissionError) and hasattr(e, 'errno') and e.errno == 22:
-                        logger.warning(f"Déconnexion USB détectée: {e}")
+                        logger.warning("Déconnexion USB détectée: %s", e)
                         self.error_occurred.emit("Périphérique USB déconnecté")
                         self.connection_lost.emit()
                         break
                     elif "ClearCommError failed" in str(e):
-                        logger.warning(f"Erreur de communication USB: {e}")
+                        logger.warning("Erreur de communication USB: %s", e)
                         self.error_occurred.emit("Erreur de communication USB - Vérifiez la connexion")
                         self.connection_lost.emit()
                         break
                     elif consecutive_errors >= 3 and any(keyword in str(e).lower() for keyword in 
                                                        ['permission denied', 'device not ready', 'no such device']):
-                        logger.warning(f"Déconnexion détectée: {e}")
+                        logger.warning("Déconnexion détectée: %s", e)
                         self.error_occurred.emit("Périphérique déconnecté")
                         self.connection_lost.emit()
                         break
-                    logger.warning(f"Erreur de lecture série (#{consecutive_errors}): {e}")
+                    logger.warning("Erreur de lecture série (#%s): %s", consecutive_errors, e)
                     if consecutive_errors >= self.max_errors:
                         self.error_occurred.emit(f"Trop d'erreurs consécutives: {e}")
                         self.connection_lost.emit()
                         break
                     # Pause progressive en cas d'erreurs (plus courte pour les erreurs USB)
                     if isinstance(e, PermissionError):
-                        self.msleep(50)  # Pause courte pour les erreurs USB
+                        self._sleep_while_running(50)  # Pause courte pour les erreurs USB
                     else:
-                        self.msleep(min(100 * consecutive_errors, 5000))
+                        self._sleep_while_running(min(100 * consecutive_errors, 5000))
                 except Exception as e:
-                    logger.error(f"Erreur inattendue dans le thread de lecture: {e}")
+                    logger.error("Erreur inattendue dans le thread de lecture: %s", e)
                     self.error_occurred.emit(f"Erreur critique: {e}")
                     break
         except Exception as e:
-            logger.error(f"Erreur fatale dans le thread de lecture: {e}")
+            logger.error("Erreur fatale dans le thread de lecture: %s", e)
             self.error_occurred.emit(f"Erreur fatale: {e}")
         finally:
             logger.debug("Thread de lecture série terminé")
             
+    def _sleep_while_running(self, duration_ms: int) -> None:
+        """
+        Pause par tranches de 10 ms, interrompue dès que stop() est appelé,
+        afin que wait() dans disconnect_port rende la main sans attendre la fin de la pause.
+        Args:
+            duration_ms (int): Durée maximale de la pause en millisecondes.
+        Returns:
+            None
+        """
+        remaining: int = duration_ms
+        while self.running and remaining > 0:
+            self.msleep(min(10, remaining))
+            remaining -= 10
+
     def stop(self) -> None:
         """
         Arrête le thread proprement.
@@ -158,7 +195,7 @@ class RobustSerialManager(QObject):
     """
     
     # Signaux thread-safe
-    data_received = pyqtSignal(bytes)
+    data_received = pyqtSignal(object)  # bytes, transmis par référence
     connection_changed = pyqtSignal(bool)
     error_occurred = pyqtSignal(str)
     statistics_updated = pyqtSignal(dict)
@@ -175,8 +212,12 @@ class RobustSerialManager(QObject):
         self.reader_thread: Optional[SerialReaderThread] = None
         self.is_connected_flag: bool = False
         
-        # Thread safety
-        self.mutex: QMutex = QMutex()
+        # Pas de verrou : connexion, déconnexion et statistiques s'exécutent dans le
+        # thread GUI. Le thread d'envoi (send_data) lit l'état, écrit sur le port via
+        # une référence locale (le port peut être fermé entre-temps : l'écriture échoue
+        # alors proprement) et incrémente tx_bytes_count, simple compteur indicatif.
+        # Garde contre un appel réentrant de connect() (ex. double clic mis en file)
+        self._connect_busy: bool = False
         
         # Statistiques
         self.rx_bytes_count: int = 0
@@ -188,15 +229,19 @@ class RobustSerialManager(QObject):
         self.last_error_time: Optional[datetime] = None
         self.error_count: int = 0
         
+        # Timers de suivi, actifs uniquement pendant une connexion (aucun réveil
+        # hors connexion) ; une précision à la seconde suffit
         # Timer pour les statistiques
         self.stats_timer: QTimer = QTimer()
+        self.stats_timer.setTimerType(Qt.VeryCoarseTimer)
+        self.stats_timer.setInterval(1000)  # Mise à jour chaque seconde
         self.stats_timer.timeout.connect(self.emit_statistics)
-        self.stats_timer.start(1000)  # Mise à jour chaque seconde
         
         # Timer de vérification de santé de la connexion
         self.health_timer: QTimer = QTimer()
+        self.health_timer.setTimerType(Qt.VeryCoarseTimer)
+        self.health_timer.setInterval(2000)  # Vérification toutes les 2 secondes
         self.health_timer.timeout.connect(self.check_connection_health)
-        self.health_timer.start(2000)  # Vérification toutes les 2 secondes
     
     @retry_with_backoff(max_retries=3, exceptions=(serial.SerialException, OSError))
     def get_available_ports(self) -> List[str]:
@@ -207,10 +252,10 @@ class RobustSerialManager(QObject):
         """
         try:
             ports: List[str] = [port.device for port in serial.tools.list_ports.comports()]
-            logger.debug(f"Ports trouvés: {ports}")
+            logger.debug("Ports trouvés: %s", ports)
             return ports
         except Exception as e:
-            logger.error(f"Erreur lors de la recherche des ports: {e}")
+            logger.error("Erreur lors de la recherche des ports: %s", e)
             raise SerialPortException(f"Impossible de lister les ports: {e}")
 
     def get_port_info(self, port_name: str) -> Dict[str, Any]:
@@ -236,7 +281,7 @@ class RobustSerialManager(QObject):
                     }
             return {"name": port_name, "description": "Port non trouvé", "available": False}
         except Exception as e:
-            logger.error(f"Erreur lors de la récupération des infos du port {port_name}: {e}")
+            logger.error("Erreur lors de la récupération des infos du port %s: %s", port_name, e)
             return {"name": port_name, "description": "Erreur", "available": False}
 
     def connect(self, port: str, **kwargs: Any) -> bool:
@@ -248,7 +293,11 @@ class RobustSerialManager(QObject):
         Returns:
             bool: True si la connexion a réussi, False sinon.
         """
-        with QMutexLocker(self.mutex):
+        if self._connect_busy:
+            logger.warning("Connexion déjà en cours sur %s, demande ignorée", port)
+            return False
+        self._connect_busy = True
+        try:
             if self.is_connected_flag:
                 self.disconnect_port()
             try:
@@ -282,14 +331,18 @@ class RobustSerialManager(QObject):
                     self.rx_bytes_count = 0
                     self.tx_bytes_count = 0
                     self.is_connected_flag = True
+                    self.stats_timer.start()
+                    self.health_timer.start()
                     self.connection_changed.emit(True)
-                    logger.info(f"Connexion établie sur {port}")
+                    logger.info("Connexion établie sur %s", port)
                 return result
             except Exception as e:
                 error_msg = f"Échec de connexion sur {port}: {e}"
                 logger.error(error_msg)
                 self.error_occurred.emit(error_msg)
                 return False
+        finally:
+            self._connect_busy = False
 
     def _validate_serial_params(self, params: Dict[str, Any]) -> None:
         """
@@ -344,50 +397,52 @@ class RobustSerialManager(QObject):
         Returns:
             None
         """
-        with QMutexLocker(self.mutex):
-            if not self.is_connected_flag:
-                return
+        if not self.is_connected_flag:
+            return
                 
-            logger.info("Déconnexion en cours...")
+        logger.info("Déconnexion en cours...")
+        self.stats_timer.stop()
+        self.health_timer.stop()
             
-            try:
-                # Arrêter le thread de lecture
-                if self.reader_thread:
-                    self.reader_thread.stop()
-                    if not self.reader_thread.wait(3000):  # Timeout de 3 secondes
-                        logger.warning("Timeout lors de l'arrêt du thread de lecture")
-                        self.reader_thread.terminate()
-                        self.reader_thread.wait(1000)
-                    self.reader_thread = None
+        try:
+            # Arrêter le thread de lecture
+            if self.reader_thread:
+                self.reader_thread.stop()
+                if not self.reader_thread.wait(3000):  # Timeout de 3 secondes
+                    logger.warning("Timeout lors de l'arrêt du thread de lecture")
+                    self.reader_thread.terminate()
+                    self.reader_thread.wait(1000)
+                self.reader_thread = None
                     
-                # Fermer le port série
-                if self.serial_port:
-                    try:
-                        if self.serial_port.is_open:
-                            self.serial_port.close()
-                    except Exception as e:
-                        logger.warning(f"Erreur lors de la fermeture du port: {e}")
-                    finally:
-                        self.serial_port = None
+            # Fermer le port série
+            if self.serial_port:
+                try:
+                    if self.serial_port.is_open:
+                        self.serial_port.close()
+                except Exception as e:
+                    logger.warning("Erreur lors de la fermeture du port: %s", e)
+                finally:
+                    self.serial_port = None
                         
-                self.is_connected_flag = False
-                self.connection_changed.emit(False)
-                logger.info("Déconnexion terminée")
+            self.is_connected_flag = False
+            self.connection_changed.emit(False)
+            logger.info("Déconnexion terminée")
                 
-            except Exception as e:
-                logger.error(f"Erreur lors de la déconnexion: {e}")
-                self.error_occurred.emit(f"Erreur de déconnexion: {e}")
+        except Exception as e:
+            logger.error("Erreur lors de la déconnexion: %s", e)
+            self.error_occurred.emit(f"Erreur de déconnexion: {e}")
                 
     def is_connected(self) -> bool:
         """
         Vérifie l'état de connexion.
+        Appelable depuis le thread d'envoi : lectures d'attributs uniquement, et
+        send_data tolère un port fermé entre ce test et l'écriture.
         Returns:
             bool: True si connecté, False sinon.
         """
-        with QMutexLocker(self.mutex):
-            return (self.is_connected_flag and 
-                   self.serial_port is not None and 
-                   getattr(self.serial_port, 'is_open', False))
+        return (self.is_connected_flag and 
+               self.serial_port is not None and 
+               getattr(self.serial_port, 'is_open', False))
                    
     def send_data(self, data: bytes) -> bool:
         """
@@ -407,15 +462,16 @@ class RobustSerialManager(QObject):
             return False
         if len(data) > 65536:  # Limite de 64KB
             raise DataTransmissionException("Données trop volumineuses (max 64KB)")
-        # DIAGNOSTIC : on désactive temporairement le mutex pour voir si le blocage vient de là
-        # with QMutexLocker(self.mutex):
         if not self.is_connected():
             self.error_occurred.emit("Aucune connexion active")
             return False
         try:
-            logger.info(f"[DEBUG] Avant serial_port.write, len={len(data)}")
-            sent = self.serial_port.write(data) if self.serial_port else 0
-            logger.info(f"[DEBUG] Après serial_port.write, sent={sent}")
+            logger.debug("Avant serial_port.write, len=%s", len(data))
+            # Une seule lecture de l'attribut : disconnect_port (thread GUI) peut le
+            # remettre à None pendant l'envoi
+            port = self.serial_port
+            sent = port.write(data) if port is not None else 0
+            logger.debug("Après serial_port.write, sent=%s", sent)
             if sent is None:
                 sent = 0
             self.tx_bytes_count += sent
@@ -423,7 +479,7 @@ class RobustSerialManager(QObject):
                 logger.warning("Aucun octet réellement envoyé sur le port série !")
                 self.error_occurred.emit("Aucun octet envoyé sur le port série !")
                 return False
-            logger.debug(f"Envoi réussi: {sent} octets")
+            logger.debug("Envoi réussi: %s octets", sent)
             return True
         except (serial.SerialException, OSError, IOError) as e:
             error_msg = f"Erreur d'envoi: {e}"
@@ -451,17 +507,10 @@ class RobustSerialManager(QObject):
             format_type = 'text'
         elif format_type == 'hex':
             format_type = 'hex'
-        # Gestion de la fin de ligne
-        if eol == 'NL':
-            data += '\n'
-        elif eol == 'CR':
-            data += '\r'
-        elif eol == 'NL+CR':
-            data += '\r\n'
-        elif eol == 'Aucun' or not eol:
-            pass  # Ne rien ajouter
         # Conversion selon le format
         if format_type == 'hex':
+            # bytes.fromhex ignore les blancs : la fin de ligne n'a jamais été
+            # transmise en hexadécimal, comportement conservé
             try:
                 hex_data = data.replace(' ', '').replace('0x', '')
                 data_bytes = bytes.fromhex(hex_data)
@@ -470,7 +519,8 @@ class RobustSerialManager(QObject):
                 self.error_occurred.emit("Format hexadécimal invalide")
                 return False
         else:
-            data_bytes = data.encode('utf-8')
+            # Encodage unique puis ajout de la fin de ligne déjà encodée ('Aucun' : rien)
+            data_bytes = data.encode('utf-8') + _EOL_BYTES.get(eol, b'')
         return self.send_data(data_bytes)
 
     def _on_data_received(self, data: bytes) -> None:
@@ -540,12 +590,11 @@ class RobustSerialManager(QObject):
         Returns:
             None
         """
-        with QMutexLocker(self.mutex):
-            self.rx_bytes_count = 0
-            self.tx_bytes_count = 0
-            self.error_count = 0
-            if self.is_connected():
-                self.connection_start_time = datetime.now()
+        self.rx_bytes_count = 0
+        self.tx_bytes_count = 0
+        self.error_count = 0
+        if self.is_connected():
+            self.connection_start_time = datetime.now()
 
     def check_connection_health(self) -> None:
         """
@@ -566,12 +615,12 @@ class RobustSerialManager(QObject):
             if self.serial_port and hasattr(self.serial_port, 'port'):
                 current_port = self.serial_port.port
                 if current_port not in available_ports:
-                    logger.warning(f"Port {current_port} n'est plus disponible - déconnexion détectée")
+                    logger.warning("Port %s n'est plus disponible - déconnexion détectée", current_port)
                     self.error_occurred.emit(f"Port {current_port} déconnecté")
                     self.disconnect_port()
                     return
         except Exception as e:
-            logger.error(f"Erreur lors de la vérification de santé: {e}")
+            logger.error("Erreur lors de la vérification de santé: %s", e)
             self.disconnect_port()
 
     def cleanup(self) -> None:
@@ -590,6 +639,6 @@ class RobustSerialManager(QObject):
                 self.disconnect_port()
             logger.info("Nettoyage du gestionnaire série terminé")
         except Exception as e:
-            logger.error(f"Erreur lors du nettoyage du gestionnaire série: {e}")
+            logger.error("Erreur lors du nettoyage du gestionnaire série: %s", e)
 
 __all__ = []
@@ -58,13 +58,13 @@ class SettingsManager:
                 # Création automatique d'un fichier de config vide si absent
                 with open(SettingsManager.CONFIG_PATH, 'w', encoding='utf-8') as f:
                     json.dump({}, f, indent=4, ensure_ascii=False)
-                logger.warning(f"Fichier de configuration absent, créé vide : {SettingsManager.CONFIG_PATH}")
+                logger.warning("Fichier de configuration absent, créé vide : %s", SettingsManager.CONFIG_PATH)
             return UtilityFunctions.load_app_settings()
         except json.JSONDecodeError as e:
-            logger.error(f"Fichier de configuration JSON corrompu : {e}")
+            logger.error("Fichier de configuration JSON corrompu : %s", e)
             raise
         except Exception as e:
-            logger.error(f"Erreur lors du chargement des paramètres: {e}")
+            logger.error("Erreur lors du chargement des paramètres: %s", e)
             raise
 
     @staticmethod
@@ -79,7 +79,7 @@ class SettingsManager:
                 json.dump(settings_dict, f, indent=4, ensure_ascii=False)
             logger.info("Tous les paramètres sauvegardés dans le JSON centralisé")
         except Exception as e:
-            logger.error(f"Erreur lors de la sauvegarde des paramètres: {e}")
+            logger.error("Erreur lors de la sauvegarde des paramètres: %s", e)
             raise
 
     @staticmethod
@@ -30,57 +30,123 @@ Auteur :
 
 from __future__ import annotations
 
-import os
+import io
+import codecs
 import re
 import logging
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Deque
 
-from PyQt5.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QTextEdit,
-                            QTabWidget, QStatusBar, QLabel, QMenu, QAction,
-                            QFontDialog, QFileDialog,
-                            QPushButton, QShortcut, QLineEdit, QComboBox, QGroupBox,
-                            QCheckBox, QSpinBox, QGridLayout, QInputDialog, QMenuBar)
-from PyQt5.QtGui import QColor, QTextCursor, QFont, QKeySequence, QTextCharFormat, QCloseEvent
-from PyQt5.QtCore import Qt, QSettings, QTimer, QThread, pyqtSignal, QObject
+from PyQt5.QtWidgets import (QMainWindow, QVBoxLayout, QWidget, QPlainTextEdit,
+                            QTabWidget, QStatusBar, QLabel, QAction, QMenuBar,
+                            QFontDialog, QMessageBox)
+from PyQt5.QtGui import QColor, QPalette, QTextCursor, QFont, QTextCharFormat, QCloseEvent
+from PyQt5.QtCore import (Qt, QTimer, QThread, pyqtSignal, QObject, QRunnable, QThreadPool,
+                          QSignalBlocker, QEvent)
 
 from communication.serial_communication import RobustSerialManager
 from interface.interface_components import (ConnectionPanel, InputPanel, AdvancedSettingsPanel)
 from core.config_manager import SettingsManager
-from interface.theme_manager import ThemeManager
-from tools.tool_checksum import ChecksumCalculator
-from tools.tool_converter import ToolConverter
+from interface.theme_manager import ThemeManager, get_theme_terminal_colors
 from system.memory_optimizer import get_ultra_memory_manager
 from core.terminal_buffer import TerminalBufferManager
 from core.tool_manager import ToolManager
 
+# Nettoyage compilé des octets reçus si numpy/numba sont installés (optionnel)
+try:
+    from core.terminal_clean_numba import clean_bytes as _clean_bytes_jit
+except ImportError:
+    _clean_bytes_jit = None
+
 logger = logging.getLogger("CrazySerialTerm")
 
-class SendWorker(QThread):
+# Nettoyage du texte reçu : séquences ANSI de couleur/effacement, puis caractères de contrôle
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[mK]')
+_CLEAN_TRANS = str.maketrans('', '', '\u2190\x08\x7f\x1b')
+# Nettoyage des octets reçus, avant décodage, dans le même ordre que le noyau Numba :
+# backspace/delete, puis séquences ANSI, puis escape isolés ('←' est retiré après décodage)
+_RX_DELETE_BYTES = b'\x08\x7f'
+_ANSI_BYTES_RE = re.compile(rb'\x1b\[[0-9;]*[mK]')
+_ESC_BYTE = b'\x1b'
+# Position de fin de document, résolue une fois pour le chemin d'affichage
+_CURSOR_END = QTextCursor.End
+
+def _clean_rx_bytes(data: Any) -> bytes:
+    """
+    Nettoie les octets reçus (version Python de core.terminal_clean_numba.clean_bytes,
+    au résultat identique octet pour octet).
+    Args:
+        data (bytes | memoryview): Octets reçus.
+    Returns:
+        bytes: Octets nettoyés, prêts à être décodés.
+    """
+    data = bytes(data).translate(None, _RX_DELETE_BYTES)
+    if _ESC_BYTE in data:
+        data = _ANSI_BYTES_RE.sub(b'', data).translate(None, _ESC_BYTE)
+    return data
+
+class SendWorker(QObject):
     """
-    Thread d'envoi asynchrone pour la communication série.
+    Worker d'envoi série persistant, déplacé une fois pour toutes dans un QThread dédié.
+    Les envois lui parviennent par signal : la file d'événements Qt du thread sert de file d'attente.
     """
     finished = pyqtSignal(bool, str, str)
 
-    def __init__(self, serial_manager: RobustSerialManager, data: str, format_type: str, eol: str) -> None:
+    def __init__(self, serial_manager: RobustSerialManager) -> None:
         """
-        Initialise le thread d'envoi.
+        Initialise le worker d'envoi.
+        Args:
+            serial_manager (RobustSerialManager): Gestionnaire série utilisé pour l'envoi.
         """
         super().__init__()
         self.serial_manager = serial_manager
-        self.data = data
-        self.format_type = format_type
-        self.eol = eol
+
+    def send(self, data: str, format_type: str, eol: str) -> None:
+        """
+        Formate et envoie une trame dans le thread d'envoi.
+        Args:
+            data (str): Données à envoyer.
+            format_type (str): Format d'envoi ('text' ou 'hex').
+            eol (str): Fin de ligne à ajouter.
+        """
+        try:
+            success = self.serial_manager.format_and_send(data, format_type, eol)
+            self.finished.emit(success, "", data)
+        except Exception as e:
+            self.finished.emit(False, str(e), data)
+
+class _SaveSettingsTask(QRunnable):
+    """
+    Écriture des paramètres dans le JSON centralisé, exécutée hors du thread GUI.
+    """
+    # Sérialise les écritures concurrentes du fichier de configuration
+    _lock = threading.Lock()
+
+    def __init__(self, settings_manager: Any, snapshot: Dict[str, Any]) -> None:
+        """
+        Initialise la tâche.
+        Args:
+            settings_manager (Any): Gestionnaire de paramètres (SettingsManager).
+            snapshot (Dict[str, Any]): Paramètres capturés sur le thread GUI.
+        """
+        super().__init__()
+        self.settings_manager = settings_manager
+        self.snapshot = snapshot
 
     def run(self) -> None:
         """
-        Exécute l'envoi asynchrone.
+        Fusionne l'instantané dans le fichier de configuration en une seule écriture.
         """
         try:
-            success = self.serial_manager.format_and_send(self.data, self.format_type, self.eol)
-            self.finished.emit(success, "", self.data)
+            with self._lock:
+                settings = self.settings_manager.load_all_settings()
+                settings.update(self.snapshot)
+                self.settings_manager.save_all_settings(settings)
         except Exception as e:
-            self.finished.emit(False, str(e), self.data)
+            logger.error("Erreur lors de la sauvegarde asynchrone des paramètres: %s", e)
 
 class Terminal(QMainWindow):
     """
@@ -90,6 +156,32 @@ class Terminal(QMainWindow):
     
     # Constantes de classe
     PORT_CHECK_INTERVAL = 5000  # ms
+    # Lignes conservées dans le terminal : Qt retire les plus anciennes à l'insertion
+    MAX_TERMINAL_BLOCKS = 5000
+    RUN_FLUSH_THRESHOLD = 4096  # caractères accumulés avant de clore un segment de couleur
+    RX_FLUSH_THRESHOLD = 64 * 1024  # octets reçus déclenchant un flush immédiat
+    RX_BUFFER_SIZE = 256 * 1024  # capacité du buffer de réception préalloué
+    FLUSH_INTERVAL = 16  # ms : une image à 60 Hz
+    MINIMIZED_FLUSH_INTERVAL = 250  # ms : fenêtre réduite, 4 flushs par seconde
+    MAX_COMMAND_HISTORY = 500  # commandes conservées dans l'historique
+    ERROR_REPEAT_WINDOW = 0.5  # s : une erreur identique dans cette fenêtre n'est pas réaffichée
+    # Libellés des actions du menu Affichage
+    _HIDE_SEND_PANEL_LABEL = 'Masquer le panneau d\'envoi'
+    _SHOW_SEND_PANEL_LABEL = 'Afficher le panneau d\'envoi'
+    _HIDE_SETTINGS_TAB_LABEL = 'Masquer l\'onglet paramètres'
+    _SHOW_SETTINGS_TAB_LABEL = 'Afficher l\'onglet paramètres'
+    # Couleurs du label d'état de connexion ('green' / 'red')
+    _CONNECTED_COLOR = QColor(0, 128, 0)
+    _DISCONNECTED_COLOR = QColor(255, 0, 0)
+    # Types de message affichés dans le terminal
+    MESSAGE_TYPES = ('text', 'system', 'error', 'sent', 'received', 'warning', 'info')
+    # Fenêtres d'outils fermées avec la fenêtre principale (noms d'attributs)
+    _MANAGED_TOOLS = ('checksum_calculator', 'data_converter')
+    # Police par défaut du terminal, créée au premier usage (QFont exige une QApplication)
+    _DEFAULT_FONT: Optional[QFont] = None
+    
+    # Demande d'envoi (données, format, fin de ligne) transmise au thread d'envoi
+    send_requested = pyqtSignal(str, str, str)
     
     def __init__(self) -> None:
         """
@@ -104,14 +196,47 @@ class Terminal(QMainWindow):
         # Gestionnaire mémoire ultra-optimisé
         self.ultra_memory = get_ultra_memory_manager()
         
-        # Buffer des couleurs pour l'optimisation mémoire
-        self._color_buffer: List[str] = []
+        # Décodeur UTF-8 incrémental : une séquence multi-octets coupée entre deux
+        # paquets est reconstituée au paquet suivant au lieu de devenir U+FFFD
+        self._rx_decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        # Octets reçus en attente d'affichage, vidés par _ultra_flush_buffer.
+        # Buffer préalloué (jamais réalloué) rempli via une memoryview ; les slots
+        # série s'exécutent dans le thread GUI : pas de verrou nécessaire.
+        self._rx_buffer = bytearray(self.RX_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buffer)
+        self._rx_used = 0
+        self._rx_flush_scheduled = False
+        # Nettoyage des octets avant décodage (Numba) ou, à défaut, du texte décodé
+        self._clean_bytes_impl = _clean_bytes_jit
+        
+        # Compteur de flushs (modulo 256) : les statistiques mémoire ne sont
+        # consultées qu'une fois par tour du compteur
+        self._flush_tick: int = 0
+        
+        # Formats de texte du thème actif, par type de message (reconstruits au changement de thème)
+        self._active_formats: Dict[str, QTextCharFormat] = {}
         
-        # Cache des formats de texte pour optimisation
-        self._text_format_cache: Dict[str, Any] = {}
+        # Segments de texte en attente d'affichage (texte, type de message) ; chaque
+        # segment est déjà concaténé par le StringIO ci-dessous : pas de join au flush
+        self._pending_text_buffer: List[Tuple[str, str]] = []
+        # Segment courant de même couleur, accumulé avant d'entrer dans _pending_text_buffer
+        self._last_color: Optional[str] = None
+        self._run_buffer = io.StringIO()
+        self._run_size = 0
+        # Méthode liée une fois pour toutes : append_text est appelé à chaque lot reçu
+        self._run_write = self._run_buffer.write
+        
+        # Timers de la fenêtre (nom, timer), enregistrés à leur création et tous
+        # arrêtés à la fermeture ; inclut le timer de nettoyage du gestionnaire mémoire.
+        # Figés en tuple (self._all_timers) une fois le dernier timer créé
+        timers: List[Tuple[str, QTimer]] = []
+        cleanup_timer = getattr(self.ultra_memory, '_cleanup_timer', None)
+        if cleanup_timer is not None:
+            timers.append(('memory_cleanup_timer', cleanup_timer))
         
         # Configuration de base
-        self.command_history: List[str] = []
+        # Historique borné : les commandes les plus anciennes sont évincées en O(1)
+        self.command_history: Deque[str] = deque(maxlen=self.MAX_COMMAND_HISTORY)
         self.history_index: int = -1
         # self.settings = QSettings("SerialTerminal", "Settings")
         self.settings = SettingsManager
@@ -132,23 +257,68 @@ class Terminal(QMainWindow):
         # Thème actuel
         self.theme_manager = ThemeManager(self.terminal_output)
         self.current_theme = 'sombre'  # Thème par défaut
+        self._applied_theme: Optional[str] = None  # Dernier thème effectivement appliqué
+        # Description de la police du terminal, tenue à jour à chaque setFont
+        self._terminal_font_data: Dict[str, Any] = {'family': 'Consolas', 'size': 10}
+        # Boîte de choix de police, créée au premier change_font puis réutilisée
+        self._font_dialog: Optional[QFontDialog] = None
         # Buffer manager pour le terminal
         self.terminal_buffer = None
         
-        # Timer ultra-optimisé pour flush
-        self._ultra_flush_timer = QTimer()
+        # Flush à la demande : armé par append_text/on_data_received, inactif sans trafic
+        self._ultra_flush_timer = QTimer(self)
+        self._ultra_flush_timer.setSingleShot(True)
+        self._ultra_flush_timer.setInterval(self.FLUSH_INTERVAL)
         self._ultra_flush_timer.timeout.connect(self._ultra_flush_buffer)
-        self._ultra_flush_timer.start(200)  # Flush moins fréquent
+        timers.append(('ultra_flush_timer', self._ultra_flush_timer))
+        # Méthodes liées du timer de flush, utilisées sur le chemin de réception
+        self._flush_timer_active = self._ultra_flush_timer.isActive
+        self._flush_timer_start = self._ultra_flush_timer.start
+        
+        # Timer de regroupement des mises à jour du compteur d'octets (≤ 5 rafraîchissements/s)
+        self._bytes_dirty: bool = False
+        self._bytes_timer = QTimer(self)
+        self._bytes_timer.setSingleShot(True)
+        self._bytes_timer.setInterval(200)
+        self._bytes_timer.timeout.connect(self._flush_bytes_label)
+        timers.append(('bytes_timer', self._bytes_timer))
+        
+        # Sauvegarde différée des paramètres : plusieurs changements rapprochés
+        # (thème, réinitialisation) ne produisent qu'une écriture du JSON
+        self._settings_dirty: bool = False
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(400)
+        self._settings_save_timer.timeout.connect(self._do_save_settings)
+        timers.append(('settings_save_timer', self._settings_save_timer))
         
-        # Limite stricte de mémoire
-        self._max_terminal_chars = 30000  # Limite ultra-stricte
+        # Format d'envoi effectif (format, fin de ligne), recalculé quand les options d'envoi changent
+        self._cached_send_fmt: Tuple[str, str] = ('text', 'Aucun')
+        # État de connexion tenu à jour par le signal connection_changed
+        self._is_connected = False
+        # Mise à jour de l'affichage de connexion programmée (une seule par tour de boucle)
+        self._connection_update_scheduled = False
+        # Dernière erreur série affichée (texte, instant monotone) pour filtrer les rafales
+        self._last_error_text: Optional[str] = None
+        self._last_error_time: float = 0.0
+        
+        # Thread d'envoi unique, créé une fois et réutilisé pour chaque trame
+        self._tx_thread = QThread()
+        self._send_worker = SendWorker(self.serial_manager)
+        self._send_worker.moveToThread(self._tx_thread)
+        self.send_requested.connect(self._send_worker.send)
+        self._send_worker.finished.connect(self._on_send_finished)
+        self._tx_thread.start()
         
         # Outils (instanciation unique, parenté correcte)
         self.tool_manager = ToolManager(self)
+        self.checksum_calculator: Optional[Any] = None
+        self.data_converter: Optional[Any] = None
         
         # Timer pour l'envoi répété
         self.repeat_timer = QTimer()
         self.repeat_timer.timeout.connect(self.send_data)
+        timers.append(('repeat_timer', self.repeat_timer))
         
         # Configuration de l'interface
         self.setupUI()
@@ -159,14 +329,19 @@ class Terminal(QMainWindow):
 
         # Timer pour vérifier les ports
         self.port_timer = QTimer()
+        # Scrutation toutes les 5 s : une précision à la seconde suffit
+        self.port_timer.setTimerType(Qt.VeryCoarseTimer)
         self.port_timer.timeout.connect(self.refresh_ports)
+        timers.append(('port_timer', self.port_timer))
         self.port_timer.start(self.PORT_CHECK_INTERVAL)
+        # Tous les timers sont créés : le registre devient un tuple figé
+        self._all_timers: Tuple[Tuple[str, QTimer], ...] = tuple(timers)
 
         # Chargement des paramètres
         self.load_settings()
 
         # Appliquer les couleurs du terminal après initialisation
-        self.theme_manager.apply_theme(self.current_theme)
+        self.apply_terminal_colors()
 
         # Affichage de la fenêtre
         self.show()
@@ -192,9 +367,21 @@ class Terminal(QMainWindow):
         self.serial_panel = ConnectionPanel()
         main_layout.addWidget(self.serial_panel)
         # Sortie du terminal
-        self.terminal_output = QTextEdit()
+        # QPlainTextEdit : mise en page par bloc de texte brut, bien plus légère que
+        # QTextEdit pour un flux de type journal ; les formats de couleur restent gérés
+        self.terminal_output = QPlainTextEdit()
         self.terminal_output.setReadOnly(True)
-        self.terminal_output.setFont(QFont("Consolas", 10))
+        # Terminal série : sans calcul de retour à la ligne par défaut
+        self.terminal_output.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self._set_terminal_font(self._default_font())
+        # Pas de pile d'annulation et document borné : coût d'insertion constant
+        self.terminal_output.setUndoRedoEnabled(False)
+        self.terminal_output.setMaximumBlockCount(self.MAX_TERMINAL_BLOCKS)
+        # Curseur d'écriture persistant sur le document, distinct du curseur de l'utilisateur
+        self._end_cursor = QTextCursor(self.terminal_output.document())
+        self._insert_text = self._end_cursor.insertText
+        self._has_selection = False
+        self.terminal_output.selectionChanged.connect(self._on_terminal_selection_changed)
         main_layout.addWidget(self.terminal_output)
         # Initialisation du buffer du terminal (corrige NoneType)
         self.terminal_buffer = TerminalBufferManager(self.terminal_output)
@@ -246,18 +433,23 @@ class Terminal(QMainWindow):
         view_menu = menubar.addMenu('Affichage')
         if view_menu is None:
             raise RuntimeError("Impossible de créer le menu 'Affichage' (QMenu)")
-        self.toggle_send_panel_action = QAction('Afficher le panneau d\'envoi', self)
+        self.toggle_send_panel_action = QAction(self._SHOW_SEND_PANEL_LABEL, self)
         self.toggle_send_panel_action.setCheckable(True)
         self.toggle_send_panel_action.setShortcut('Ctrl+T')
         self.toggle_send_panel_action.setChecked(True)
         self.toggle_send_panel_action.triggered.connect(self.toggle_send_panel_visibility)
         view_menu.addAction(self.toggle_send_panel_action)
-        self.toggle_settings_tab_action = QAction('Afficher l\'onglet paramètres', self)
+        self.toggle_settings_tab_action = QAction(self._SHOW_SETTINGS_TAB_LABEL, self)
         self.toggle_settings_tab_action.setCheckable(True)
         self.toggle_settings_tab_action.setShortcut('Ctrl+Shift+S')
         self.toggle_settings_tab_action.setChecked(False)
         self.toggle_settings_tab_action.triggered.connect(self.toggle_settings_tab_visibility)
         view_menu.addAction(self.toggle_settings_tab_action)
+        self.toggle_line_wrap_action = QAction('Retour à la ligne automatique', self)
+        self.toggle_line_wrap_action.setCheckable(True)
+        self.toggle_line_wrap_action.setChecked(False)
+        self.toggle_line_wrap_action.toggled.connect(self.set_line_wrap)
+        view_menu.addAction(self.toggle_line_wrap_action)
         view_menu.addSeparator()
         themes_menu = view_menu.addMenu('Thèmes')
         if themes_menu is None:
@@ -284,7 +476,6 @@ class Terminal(QMainWindow):
         if tools_menu is None:
             raise RuntimeError("Impossible de créer le menu 'Outils' (QMenu)")
         # --- Menu Outils dynamique amélioré ---
-        from PyQt5.QtWidgets import QMessageBox
         # Tri alphabétique des outils
         for tool_name in sorted(self.tool_manager.tools.keys()):
             tool_instance = self.tool_manager.tools[tool_name]
@@ -318,6 +509,14 @@ class Terminal(QMainWindow):
         self.port_label = QLabel("Aucun port")
         self.bytes_label = QLabel("Octets: 0 ↑ / 0 ↓")
         
+        # Palettes du label d'état construites une fois : seule la couleur du texte est fixée,
+        # le reste suit la palette du thème
+        role = self.connection_status_label.foregroundRole()
+        self._palette_connected = QPalette()
+        self._palette_connected.setColor(role, self._CONNECTED_COLOR)
+        self._palette_disconnected = QPalette()
+        self._palette_disconnected.setColor(role, self._DISCONNECTED_COLOR)
+        
         self.status_bar.addWidget(self.connection_status_label)
         self.status_bar.addPermanentWidget(self.port_label)
         self.status_bar.addPermanentWidget(self.bytes_label)
@@ -338,6 +537,9 @@ class Terminal(QMainWindow):
             
             # Signaux du panneau des paramètres avancés
             self.advanced_panel.send_settings_changed.connect(self.on_send_settings_changed)
+            # Décocher le groupe n'émet pas send_settings_changed : suivre aussi toggled
+            self.advanced_panel.send_group.toggled.connect(self._refresh_send_format)
+            self._refresh_send_format()
             self.advanced_panel.display_settings_changed.connect(self.on_display_settings_changed)
             self.advanced_panel.serial_settings_changed.connect(self.on_serial_settings_changed)
             
@@ -350,7 +552,7 @@ class Terminal(QMainWindow):
             logger.debug("Tous les signaux connectés avec succès")
             
         except Exception as e:
-            logger.error(f"Erreur lors de la connexion des signaux: {e}")
+            logger.error("Erreur lors de la connexion des signaux: %s", e)
             raise
     
     def connect_serial(self) -> None:
@@ -366,7 +568,7 @@ class Terminal(QMainWindow):
                 self.append_text("[Système] Échec de la connexion série\n", 'error')
         except Exception as e:
             self.append_text(f"[Système] Erreur de connexion: {str(e)}\n", 'error')
-            logger.error(f"Erreur de connexion série: {str(e)}")
+            logger.error("Erreur de connexion série: %s", e)
     
     def disconnect_serial(self) -> None:
         """
@@ -378,7 +580,7 @@ class Terminal(QMainWindow):
             self.serial_panel.set_connected(False)
         except Exception as e:
             self.append_text(f"[Système] Erreur de déconnexion: {str(e)}\n", 'error')
-            logger.error(f"Erreur de déconnexion série: {str(e)}")
+            logger.error("Erreur de déconnexion série: %s", e)
     
     def send_data(self, data: str, format_type: str = 'text') -> None:
         """
@@ -388,9 +590,8 @@ class Terminal(QMainWindow):
             data (str): Données à envoyer.
             format_type (str): Format d'envoi ('text' ou 'hex').
         """
-        logger.info(f"[DEBUG] Slot send_data appelé avec data='{data}' format_type='{format_type}'")
-        logger.info(f"[DEBUG] Slot send_data appelé avec data='{data}' format_type='{format_type}'")
-        if not self.serial_manager.is_connected():
+        logger.debug("Slot send_data appelé avec data='%s' format_type='%s'", data, format_type)
+        if not self._is_connected:
             self.append_text("[Système] Aucune connexion active\n", 'system')
             return
         # Validation des données d'entrée
@@ -401,23 +602,13 @@ class Terminal(QMainWindow):
             self.append_text("[Système] Données trop longues (max 1024 caractères)\n", 'error')
             return
         try:
-            # Récupérer les paramètres d'envoi avancés si activés
-            if self.advanced_panel.send_group.isChecked():
-                send_settings = self.advanced_panel.get_send_settings()
-                format_type = send_settings.get('format', 'ASCII').lower()
-                eol = send_settings.get('eol', 'Aucun')
-            else:
-                format_type = 'text'
-                eol = 'Aucun'
-            # Utilisation d'un QThread pour l'envoi (formatage côté communication)
-            self.send_worker = SendWorker(self.serial_manager, data, format_type, eol)
-            self.send_worker.finished.connect(self._on_send_finished)
-            self.send_worker.start()
-            # Historique log si activé
-            self.log_terminal_event('envoyé', data)
+            # Paramètres d'envoi avancés, mis en cache par _refresh_send_format
+            format_type, eol = self._cached_send_fmt
+            # Envoi dans le thread d'envoi persistant (formatage côté communication)
+            self.send_requested.emit(data, format_type, eol)
         except Exception as e:
             self.append_text(f"Erreur d'envoi: {str(e)}\n", 'error')
-            logger.error(f"Erreur d'envoi de données: {str(e)}")
+            logger.error("Erreur d'envoi de données: %s", e)
 
     def _on_send_finished(self, success: bool, error_msg: str, data: str) -> None:
         """
@@ -437,38 +628,37 @@ class Terminal(QMainWindow):
         # Efface la barre d'envoi après chaque commande
         if self.input_panel:
             self.input_panel.clear_input()
-        self.send_worker = None
-        logger.info(f"[DEBUG] Slot _on_send_finished appelé, success={success}, error_msg='{error_msg}'")
+        logger.debug("Slot _on_send_finished appelé, success=%s, error_msg='%s'", success, error_msg)
     
     def on_connection_changed(self, connected: bool) -> None:
         """
         Slot appelé lors d'un changement d'état de connexion série.
+        L'état est pris en compte immédiatement ; l'affichage est mis à jour au tour
+        de boucle suivant, une seule fois pour une rafale de changements.
         """
-        self.update_connection_status(connected)
+        self._is_connected = connected
+        if not self._connection_update_scheduled:
+            self._connection_update_scheduled = True
+            QTimer.singleShot(0, self._apply_connection_state)
 
-    def on_data_received(self, data: bytes) -> None:
+    def _apply_connection_state(self) -> None:
         """
-        Slot appelé lors de la réception de données sur le port série.
-        Args:
-            data (bytes): Données reçues.
+        Applique à l'affichage le dernier état de connexion reçu.
         """
-        logger.info(f"[DEBUG] Slot on_data_received appelé, {len(data)} octets reçus")
-        try:
-            # Décodage et nettoyage
-            text = data.decode('utf-8', errors='replace')
-            clean_text = self.clean_received_text(text)
-            self.append_text(clean_text, 'received')
-            # Mise à jour des statistiques
-            if hasattr(self, 'update_bytes_counter'):
-                self.update_bytes_counter(received=len(data))
-            self.log_terminal_event('reçu', clean_text)
-        except Exception as e:
-            logger.error(f"Erreur lors du traitement des données reçues: {e}")
+        self._connection_update_scheduled = False
+        self.update_connection_status(self._is_connected)
 
     def on_error_occurred(self, error_message: str) -> None:
         """
         Slot appelé lors d'une erreur série.
+        Une même erreur répétée dans ERROR_REPEAT_WINDOW n'est affichée qu'une fois.
         """
+        now = time.monotonic()
+        if error_message == self._last_error_text and now - self._last_error_time < self.ERROR_REPEAT_WINDOW:
+            self._last_error_time = now
+            return
+        self._last_error_text = error_message
+        self._last_error_time = now
         self.append_text(f"[Erreur] {error_message}\n", 'error')
 
     def on_statistics_updated(self, stats: dict) -> None:
@@ -477,10 +667,39 @@ class Terminal(QMainWindow):
         """
         rx = stats.get('rx_bytes', 0) if isinstance(stats, dict) else 0
         tx = stats.get('tx_bytes', 0) if isinstance(stats, dict) else 0
-        if hasattr(self, 'bytes_label') and self.bytes_label:
-            self.bytes_label.setText(f"Octets: {tx} ↑ / {rx} ↓")
-        else:
-            logger.warning("bytes_label absent lors de la mise à jour des statistiques")
+        # Les statistiques du gestionnaire série font foi pour les compteurs ;
+        # le label est rafraîchi par _flush_bytes_label, au rythme de _bytes_timer.
+        # Émises chaque seconde même sans trafic : rien à faire si rien n'a changé
+        if rx == self.rx_bytes_count and tx == self.tx_bytes_count:
+            return
+        self.rx_bytes_count = rx
+        self.tx_bytes_count = tx
+        self._bytes_dirty = True
+        if not self._bytes_timer.isActive():
+            self._bytes_timer.start()
+
+    def update_bytes_counter(self, received: int = 0, sent: int = 0) -> None:
+        """
+        Met à jour les compteurs d'octets. L'affichage est regroupé par un timer
+        (au plus une mise à jour du label toutes les 200 ms).
+        Args:
+            received (int): Nombre d'octets reçus à ajouter.
+            sent (int): Nombre d'octets envoyés à ajouter.
+        """
+        self.rx_bytes_count += received
+        self.tx_bytes_count += sent
+        self._bytes_dirty = True
+        if not self._bytes_timer.isActive():
+            self._bytes_timer.start()
+
+    def _flush_bytes_label(self) -> None:
+        """
+        Rafraîchit le label du compteur d'octets si des compteurs ont changé.
+        """
+        if not self._bytes_dirty:
+            return
+        self._bytes_dirty = False
+        self.bytes_label.setText(f"Octets: {self.tx_bytes_count} ↑ / {self.rx_bytes_count} ↓")
     
     # Correction des signatures et docstrings pour les dernières méthodes publiques
     def on_data_received(self, data: bytes) -> None:
@@ -489,19 +708,65 @@ class Terminal(QMainWindow):
         Args:
             data (bytes): Données reçues.
         """
-        logger.info(f"[DEBUG] Slot on_data_received appelé, {len(data)} octets reçus")
+        # Chemin chaud : on ne construit le message que si le niveau est actif
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Slot on_data_received appelé, %s octets reçus", len(data))
         try:
-            # Décodage et nettoyage
-            text = data.decode('utf-8', errors='replace')
-            clean_text = self.clean_received_text(text)
-            self.append_text(clean_text, 'received')
-            # Mise à jour des statistiques
-            if hasattr(self, 'update_bytes_counter'):
-                self.update_bytes_counter(received=len(data))
+            # Les octets sont regroupés puis décodés et affichés par _ultra_flush_buffer
+            size = len(data)
+            if self._rx_used + size > self.RX_BUFFER_SIZE:
+                # Buffer plein : décodage immédiat de ce qui est en attente
+                self._drain_rx_buffer()
+            if size > self.RX_BUFFER_SIZE:
+                self._decode_rx(data)
+            else:
+                self._rx_view[self._rx_used:self._rx_used + size] = data
+                self._rx_used += size
+            if self._rx_used > self.RX_FLUSH_THRESHOLD and not self._rx_flush_scheduled:
+                # Borne la latence et la mémoire sous fort débit
+                self._rx_flush_scheduled = True
+                QTimer.singleShot(0, self._ultra_flush_buffer)
+            elif not self._flush_timer_active():
+                self._flush_timer_start()
+            # Mise à jour des statistiques (label rafraîchi par _bytes_timer)
+            self.rx_bytes_count += size
+            self._bytes_dirty = True
+            if not self._bytes_timer.isActive():
+                self._bytes_timer.start()
         except Exception as e:
-            logger.error(f"Erreur lors du traitement des données reçues: {e}")
+            logger.error("Erreur lors du traitement des données reçues: %s", e)
             raise
 
+    def _drain_rx_buffer(self) -> None:
+        """
+        Décode et nettoie en une fois tous les octets reçus depuis le dernier flush,
+        puis les place dans le buffer d'affichage.
+        """
+        self._rx_flush_scheduled = False
+        if not self._rx_used:
+            return
+        # Vue sur la partie remplie, sans copie : un seul decode/insertText pour tout le lot
+        try:
+            self._decode_rx(self._rx_view[:self._rx_used])
+        finally:
+            self._rx_used = 0
+
+    def _decode_rx(self, data: Any) -> None:
+        """
+        Nettoie et décode un lot d'octets reçus puis l'ajoute au terminal.
+        Args:
+            data (bytes | memoryview): Octets reçus.
+        """
+        # Même nettoyage d'octets sur les deux chemins (compilé ou Python)
+        clean_bytes = self._clean_bytes_impl or _clean_rx_bytes
+        clean_text = self._rx_decoder.decode(clean_bytes(data))
+        # '←' retiré après décodage : le décodeur incrémental reconstitue aussi
+        # un caractère coupé entre deux lectures
+        if '\u2190' in clean_text:
+            clean_text = clean_text.replace('\u2190', '')
+        if clean_text:
+            self.append_text(clean_text, 'received')
+
     def clean_received_text(self, text: str) -> str:
         """
         Nettoie le texte reçu en supprimant les caractères indésirables et séquences ANSI.
@@ -510,22 +775,9 @@ class Terminal(QMainWindow):
         Returns:
             str: Texte nettoyé.
         """
-        # Liste des caractères à supprimer
-        chars_to_remove = [
-            '←',     # Caractère flèche gauche
-            '\x08',  # Backspace
-            '\x7f',  # Delete
-            '\x1b',  # Escape
-        ]
-        
-        # Supprimer chaque caractère indésirable
-        for char in chars_to_remove:
-            text = text.replace(char, '')
-        
-        # Supprimer les séquences d'échappement ANSI courantes
-        text = re.sub(r'\x1b\[[0-9;]*[mK]', '', text)
-        
-        return text
+        # Séquences ANSI d'abord (elles commencent par ESC), puis une seule passe
+        # translate pour '←', backspace, delete et escape isolés
+        return _ANSI_RE.sub('', text).translate(_CLEAN_TRANS)
 
     def update_connection_status(self, connected: bool) -> None:
         """
@@ -536,89 +788,94 @@ class Terminal(QMainWindow):
             None
         """
         try:
-            palette = self.connection_status_label.palette()
+            # Nouvelle session série : oublier une séquence multi-octets en suspens
+            self._rx_decoder.reset()
             if connected:
                 self.connection_status_label.setText("Connecté")
-                palette.setColor(self.connection_status_label.foregroundRole(), QColor('green'))
-                self.connection_status_label.setPalette(palette)
+                self.connection_status_label.setPalette(self._palette_connected)
                 port = self.serial_panel.get_connection_params()['port']
                 self.port_label.setText(f"Port: {port}")
                 self.serial_panel.set_connected(True)
             else:
                 self.connection_status_label.setText("Déconnecté")
-                palette.setColor(self.connection_status_label.foregroundRole(), QColor('red'))
-                self.connection_status_label.setPalette(palette)
+                self.connection_status_label.setPalette(self._palette_disconnected)
                 self.port_label.setText("Aucun port")
                 self.serial_panel.set_connected(False)
                 self.refresh_ports()
-            logger.info(f"État de connexion mis à jour: {'Connecté' if connected else 'Déconnecté'}")
+            logger.info("État de connexion mis à jour: %s", 'Connecté' if connected else 'Déconnecté')
         except Exception as e:
-            logger.error(f"Erreur lors de la mise à jour de l'état de connexion: {e}")
+            logger.error("Erreur lors de la mise à jour de l'état de connexion: %s", e)
 
     def change_theme(self, theme_name: str) -> None:
         """
         Change le thème de l'application via ThemeManager.
+        Ne fait rien si ce thème est déjà appliqué (évite un repolish Qt inutile).
         """
+        if theme_name == self._applied_theme:
+            return
         try:
+            # Palette globale ; ThemeManager synchronise aussi le buffer du terminal
             self.theme_manager.apply_theme(theme_name)
             self.current_theme = theme_name
-            # Synchronise le buffer du terminal avec le nouveau thème
-            if hasattr(self, 'terminal_buffer') and self.terminal_buffer:
-                self.terminal_buffer.set_theme(theme_name)
-            self.refresh_terminal_display()  # Forcer le rafraîchissement
-            self.settings.save_setting('theme', theme_name)  # Persistance via JSON
-            logger.info(f"Thème changé: {theme_name}")
+            self._build_active_formats()
+            # Feuille de style du terminal uniquement : l'historique n'est pas restylé,
+            # les nouveaux segments prennent les formats reconstruits ci-dessus
+            self.theme_manager.refresh_terminal_display(theme_name)
+            self._applied_theme = theme_name
+            self._schedule_save_settings()  # Persistance via JSON (différée)
+            logger.info("Thème changé: %s", theme_name)
         except Exception as e:
-            logger.error(f"Erreur lors du changement de thème: {e}")
+            logger.error("Erreur lors du changement de thème: %s", e)
 
     def apply_terminal_colors(self) -> None:
         """
-        Applique les couleurs du terminal via ThemeManager.
+        Applique les couleurs du terminal via ThemeManager, si le thème courant
+        n'a pas déjà été appliqué (par exemple par load_settings).
         """
+        if self.current_theme == self._applied_theme:
+            return
         try:
             self.theme_manager.apply_theme(self.current_theme)
+            self._build_active_formats()
+            self.theme_manager.refresh_terminal_display(self.current_theme)
+            self._applied_theme = self.current_theme
         except Exception as e:
-            logger.error(f"Erreur lors de l'application des couleurs: {e}")
+            logger.error("Erreur lors de l'application des couleurs: %s", e)
 
     def refresh_terminal_display(self) -> None:
         """
-        Force la mise à jour visuelle du terminal avec les nouvelles couleurs via ThemeManager.
+        Applique au terminal la feuille de style du thème courant via ThemeManager
+        (fond et couleur par défaut), sans parcourir ni remettre en page le document.
         """
         try:
             self.theme_manager.refresh_terminal_display(self.current_theme)
         except Exception as e:
-            logger.error(f"Erreur lors de la mise à jour du terminal: {e}")
+            logger.error("Erreur lors de la mise à jour du terminal: %s", e)
 
-    def apply_theme(self, theme_name: str) -> None:
-        """
-        Applique un thème à l'application via ThemeManager.
-        """
-        self.change_theme(theme_name)
+    # Applique un thème à l'application : même méthode que change_theme, sans appel intermédiaire
+    apply_theme = change_theme
 
     def load_settings(self) -> None:
         """
         Charge tous les paramètres utilisateur (thème, UI, groupes, options avancées, taille/fenêtre, police, panneaux) depuis le JSON centralisé.
+        Le fichier est lu et parsé une seule fois sur le thread GUI.
         """
         try:
+            stored = self.settings.load_all_settings()
             # Thème
-            theme = self.settings.load_setting('theme', 'sombre')
+            theme = stored.get('theme', 'sombre')
             if theme in ['clair', 'sombre', 'hacker']:
                 self.change_theme(theme)
             # Paramètres avancés (groupes, options, log...)
-            advanced_settings = self.settings.load_setting('advanced_settings', None)
+            advanced_settings = stored.get('advanced_settings')
             if advanced_settings and self.advanced_panel:
                 self.advanced_panel.set_all_settings(advanced_settings)
             # Visibilité des panneaux
-            send_panel_visible = self.settings.load_setting('send_panel_visible', True)
+            send_panel_visible = stored.get('send_panel_visible', True)
             if self.input_panel:
                 self.input_panel.setVisible(send_panel_visible)
                 # Synchroniser la case à cocher avec la visibilité réelle
-                if self.toggle_send_panel_action:
-                    self.toggle_send_panel_action.setChecked(send_panel_visible)
-                    if send_panel_visible:
-                        self.toggle_send_panel_action.setText('Masquer le panneau d\'envoi')
-                    else:
-                        self.toggle_send_panel_action.setText('Afficher le panneau d\'envoi')
+                self._sync_send_panel_action(send_panel_visible)
             if self.advanced_panel:
                 settings_tab_visible = advanced_settings.get('settings_tab_visible', False) if advanced_settings else False
                 if settings_tab_visible and not self.settings_tab_visible:
@@ -626,43 +883,79 @@ class Terminal(QMainWindow):
                 elif not settings_tab_visible and self.settings_tab_visible:
                     self.toggle_settings_tab_visibility()
             # Taille et position de la fenêtre
-            geometry = self.settings.load_setting('window_geometry', None)
+            geometry = stored.get('window_geometry')
             if geometry:
                 self.setGeometry(*geometry)
+            # Retour à la ligne du terminal (désactivé par défaut)
+            if self.toggle_line_wrap_action:
+                self.toggle_line_wrap_action.setChecked(stored.get('terminal_line_wrap', False))
             # Police du terminal
-            font_data = self.settings.load_setting('terminal_font', None)
+            font_data = stored.get('terminal_font')
             if font_data and self.terminal_output:
                 font = QFont(font_data.get('family', 'Consolas'), font_data.get('size', 10))
-                self.terminal_output.setFont(font)
+                self._set_terminal_font(font)
         except Exception as e:
-            logger.error(f"Erreur lors du chargement des paramètres: {e}")
+            logger.error("Erreur lors du chargement des paramètres: %s", e)
 
     def save_settings(self) -> None:
         """
         Sauvegarde tous les paramètres utilisateur (thème, UI, groupes, options avancées, taille/fenêtre, police, panneaux) dans le JSON centralisé.
+        Les valeurs sont lues sur le thread GUI ; l'écriture disque est confiée au QThreadPool global.
         """
         try:
-            self.settings.save_setting('theme', getattr(self, 'current_theme', 'sombre'))
+            self._settings_dirty = False
+            snapshot: Dict[str, Any] = {'theme': getattr(self, 'current_theme', 'sombre')}
             # Paramètres avancés (groupes, options, log...)
             if self.advanced_panel:
                 advanced_settings = self.advanced_panel.get_all_settings()
                 # Sauvegarder la visibilité de l'onglet paramètres
                 advanced_settings['settings_tab_visible'] = self.settings_tab_visible
-                self.settings.save_setting('advanced_settings', advanced_settings)
+                snapshot['advanced_settings'] = advanced_settings
             # Visibilité du panneau d'envoi
             if self.input_panel:
-                self.settings.save_setting('send_panel_visible', self.input_panel.isVisible())
+                snapshot['send_panel_visible'] = self.input_panel.isVisible()
             # Taille et position de la fenêtre
-            geometry = (self.x(), self.y(), self.width(), self.height())
-            self.settings.save_setting('window_geometry', geometry)
-            # Police du terminal
+            snapshot['window_geometry'] = (self.x(), self.y(), self.width(), self.height())
+            # Retour à la ligne et police du terminal
             if self.terminal_output:
-                font = self.terminal_output.font()
-                font_data = {'family': font.family(), 'size': font.pointSize()}
-                self.settings.save_setting('terminal_font', font_data)
+                snapshot['terminal_line_wrap'] = self.terminal_output.lineWrapMode() != QPlainTextEdit.NoWrap
+                snapshot['terminal_font'] = dict(self._terminal_font_data)
+            QThreadPool.globalInstance().start(_SaveSettingsTask(self.settings, snapshot))
         except Exception as e:
-            logger.error(f"Erreur lors de la sauvegarde des paramètres: {e}")
+            logger.error("Erreur lors de la sauvegarde des paramètres: %s", e)
+
+    def _schedule_save_settings(self) -> None:
+        """
+        Marque les paramètres comme modifiés et (re)lance le timer de sauvegarde différée.
+        """
+        self._settings_dirty = True
+        self._settings_save_timer.start()
+
+    def _do_save_settings(self) -> None:
+        """
+        Sauvegarde les paramètres si une modification est en attente.
+        """
+        if self._settings_dirty:
+            self.save_settings()
     
+    def changeEvent(self, event: QEvent) -> None:
+        """
+        Ralentit l'affichage des données reçues quand la fenêtre est réduite.
+        Le document reste borné par MAX_TERMINAL_BLOCKS ; au rétablissement,
+        le texte en attente est affiché immédiatement.
+        Args:
+            event (QEvent): Événement de changement d'état.
+        """
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self._ultra_flush_timer.setInterval(self.MINIMIZED_FLUSH_INTERVAL)
+            elif self._ultra_flush_timer.interval() != self.FLUSH_INTERVAL:
+                self._ultra_flush_timer.setInterval(self.FLUSH_INTERVAL)
+                if self._ultra_flush_timer.isActive():
+                    self._ultra_flush_timer.stop()
+                    self._ultra_flush_buffer()
+        super().changeEvent(event)
+
     def closeEvent(self, event: QCloseEvent) -> None:
         """
         Gère la fermeture de l'application de manière ultra-robuste avec nettoyage mémoire complet.
@@ -677,95 +970,92 @@ class Terminal(QMainWindow):
             self._stop_all_timers_and_memory_cleanup()
             # 2. Flush final du buffer de texte
             try:
-                if hasattr(self, '_pending_text_buffer') and self._pending_text_buffer:
+                self._drain_rx_buffer()
+                if self._pending_text_buffer or self._run_size:
                     self._flush_text_buffer()
                     logger.debug("Buffer de texte final flushé")
             except Exception as e:
-                logger.warning(f"Erreur flush final: {e}")
+                logger.warning("Erreur flush final: %s", e)
+            
+            # Arrêt du thread d'envoi (les trames déjà en file sont traitées)
+            try:
+                self._tx_thread.quit()
+                self._tx_thread.wait(1000)
+            except Exception as e:
+                logger.warning("Erreur arrêt du thread d'envoi: %s", e)
             
             # 3. Fermer les connexions série de manière propre
-            if hasattr(self, 'serial_manager') and self.serial_manager:
+            if self.serial_manager is not None:
                 try:
                     if self.serial_manager.is_connected():
                         logger.info("Déconnexion du port série...")
+                        # disconnect_port est synchrone : il attend la fin du thread
+                        # de lecture et ferme le port avant de rendre la main
                         self.serial_manager.disconnect_port()
-                        
-                        # Attendre un peu pour la déconnexion propre
-                        from PyQt5.QtCore import QEventLoop, QTimer
-                        loop = QEventLoop()
-                        QTimer.singleShot(200, loop.quit)
-                        loop.exec_()
-                        
                 except Exception as e:
-                    logger.error(f"Erreur lors de la déconnexion série: {str(e)}")
+                    logger.error("Erreur lors de la déconnexion série: %s", e)
             
-            # 4. Sauvegarder les paramètres
+            # 4. Sauvegarder les paramètres (remplace toute sauvegarde différée en attente,
+            # dont le timer a été arrêté avec les autres)
             try:
                 self.save_settings()
+                # Laisser l'écriture asynchrone se terminer avant de quitter
+                QThreadPool.globalInstance().waitForDone(500)
                 logger.debug("Paramètres sauvegardés")
             except Exception as e:
-                logger.error(f"Erreur lors de la sauvegarde: {str(e)}")
+                logger.error("Erreur lors de la sauvegarde: %s", e)
             
             # 5. Fermer les fenêtres des outils
-            tools_to_close = []
-            if hasattr(self, 'checksum_calculator') and self.checksum_calculator:
-                tools_to_close.append(('checksum_calculator', self.checksum_calculator))
-            if hasattr(self, 'data_converter') and self.data_converter:
-                tools_to_close.append(('data_converter', self.data_converter))
-                
-            for tool_name, tool in tools_to_close:
+            for tool_name in self._MANAGED_TOOLS:
+                tool = getattr(self, tool_name, None)
+                if tool is None:
+                    continue
                 try:
-                    if hasattr(tool, 'close'):
-                        tool.close()
-                        logger.debug(f"Outil {tool_name} fermé")
+                    tool.close()
+                    logger.debug("Outil %s fermé", tool_name)
                 except Exception as e:
-                    logger.warning(f"Erreur fermeture {tool_name}: {e}")
+                    logger.warning("Erreur fermeture %s: %s", tool_name, e)
             
             # 6. Nettoyage mémoire ultra-complet
             try:
+                # Texte en attente du buffer affiché et timer de flush arrêté : il n'a
+                # pas de parent Qt et ne doit plus se déclencher après la destruction du widget
+                if self.terminal_buffer is not None:
+                    self.terminal_buffer.force_flush()
+                # Casser le cycle terminal_output <-> terminal_buffer : le comptage de
+                # références libère alors le buffer sans passe du GC
+                if self.terminal_output is not None:
+                    self.terminal_output.terminal_buffer = None
+                self.terminal_buffer = None
+                
                 # Vider et nettoyer le terminal
-                if hasattr(self, 'terminal_output') and self.terminal_output:
+                if self.terminal_output is not None:
                     self.terminal_output.clear()
                     self.terminal_output.deleteLater()
                     
-                # Nettoyer les caches
-                if hasattr(self, '_text_format_cache'):
-                    self._text_format_cache.clear()
-                if hasattr(self, '_pending_text_buffer'):
-                    self._pending_text_buffer.clear()
+                # Nettoyer les buffers
+                self._pending_text_buffer.clear()
+                self._active_formats.clear()
                     
                 # Nettoyer l'historique des commandes
-                if hasattr(self, 'command_history'):
-                    self.command_history.clear()
-                    
-                # Forcer le garbage collection multiple fois
-                import gc
-                for _ in range(3):
-                    gc.collect()
+                self.command_history.clear()
                     
+                # Pas de gc.collect() forcé : la fin du processus libère la mémoire
                 logger.debug("Nettoyage mémoire complet effectué")
                 
             except Exception as e:
-                logger.warning(f"Erreur lors du nettoyage final: {e}")
+                logger.warning("Erreur lors du nettoyage final: %s", e)
             
             event.accept()
             logger.info("Application fermée proprement avec nettoyage complet")
             
         except Exception as e:
-            logger.error(f"Erreur critique lors de la fermeture: {str(e)}")
+            logger.error("Erreur critique lors de la fermeture: %s", e)
             # En cas d'erreur critique, forcer la fermeture avec nettoyage d'urgence
             try:
                 # Arrêt d'urgence des timers
-                if hasattr(self, 'port_timer'):
-                    self.port_timer.stop()
-                if hasattr(self, 'repeat_timer'):
-                    self.repeat_timer.stop()
-                if hasattr(self, '_update_timer'):
-                    self._update_timer.stop()
-                    
-                # Nettoyage d'urgence
-                import gc
-                gc.collect()
+                for _, timer in self._all_timers:
+                    timer.stop()
             except:
                 pass
             event.accept()
@@ -775,27 +1065,15 @@ class Terminal(QMainWindow):
         Arrête tous les timers (y compris mémoire) et loggue l'état pour robustesse maximale.
         """
         try:
-            timers = []
-            if hasattr(self, 'port_timer') and self.port_timer:
-                timers.append(('port_timer', self.port_timer))
-            if hasattr(self, 'repeat_timer') and self.repeat_timer:
-                timers.append(('repeat_timer', self.repeat_timer))
-            if hasattr(self, '_update_timer') and self._update_timer:
-                timers.append(('update_timer', self._update_timer))
-            if hasattr(self, '_ultra_flush_timer') and self._ultra_flush_timer:
-                timers.append(('ultra_flush_timer', self._ultra_flush_timer))
-            # Arrêt du timer mémoire si présent
-            if hasattr(self, 'ultra_memory') and hasattr(self.ultra_memory, '_cleanup_timer'):
-                timers.append(('memory_cleanup_timer', self.ultra_memory._cleanup_timer))
-            for timer_name, timer in timers:
+            # QTimer.stop() est sans effet sur un timer déjà arrêté : pas de test isActive()
+            for timer_name, timer in self._all_timers:
                 try:
-                    if timer.isActive():
-                        timer.stop()
-                        logger.debug(f"Timer {timer_name} arrêté")
+                    timer.stop()
+                    logger.debug("Timer %s arrêté", timer_name)
                 except Exception as e:
-                    logger.warning(f"Erreur arrêt timer {timer_name}: {e}")
+                    logger.warning("Erreur arrêt timer %s: %s", timer_name, e)
         except Exception as e:
-            logger.error(f"Erreur lors de l'arrêt des timers: {e}")
+            logger.error("Erreur lors de l'arrêt des timers: %s", e)
 
     def on_send_settings_changed(self, settings: Dict[str, Any]) -> None:
         """
@@ -806,12 +1084,23 @@ class Terminal(QMainWindow):
             None
         """
         try:
-            # ...traitement des paramètres d'envoi...
-            pass
+            self._refresh_send_format()
         except Exception as e:
-            logger.error(f"Erreur lors du changement des paramètres d'envoi : {str(e)}")
+            logger.error("Erreur lors du changement des paramètres d'envoi : %s", e)
             raise
 
+    def _refresh_send_format(self, *_args: Any) -> None:
+        """
+        Recalcule le couple (format, fin de ligne) utilisé par send_data à partir
+        du panneau des paramètres avancés.
+        """
+        if self.advanced_panel and self.advanced_panel.send_group.isChecked():
+            send_settings = self.advanced_panel.get_send_settings()
+            self._cached_send_fmt = (send_settings.get('format', 'ASCII').lower(),
+                                     send_settings.get('eol', 'Aucun'))
+        else:
+            self._cached_send_fmt = ('text', 'Aucun')
+
     def on_display_settings_changed(self, settings: Dict[str, Any]) -> None:
         """
         Traite les changements de paramètres d'affichage.
@@ -824,7 +1113,7 @@ class Terminal(QMainWindow):
             # ...traitement des paramètres d'affichage...
             pass
         except Exception as e:
-            logger.error(f"Erreur lors du changement des paramètres d'affichage : {str(e)}")
+            logger.error("Erreur lors du changement des paramètres d'affichage : %s", e)
             raise
 
     def on_serial_settings_changed(self, settings: Dict[str, Any]) -> None:
@@ -839,49 +1128,9 @@ class Terminal(QMainWindow):
             # ...traitement des paramètres série...
             pass
         except Exception as e:
-            logger.error(f"Erreur lors du changement des paramètres série : {str(e)}")
+            logger.error("Erreur lors du changement des paramètres série : %s", e)
             raise
     
-    def change_theme(self, theme_name: str) -> None:
-        """
-        Change le thème de l'application via ThemeManager.
-        """
-        try:
-            self.theme_manager.apply_theme(theme_name)
-            self.current_theme = theme_name
-            # Synchronise le buffer du terminal avec le nouveau thème
-            if hasattr(self, 'terminal_buffer') and self.terminal_buffer:
-                self.terminal_buffer.set_theme(theme_name)
-            self.refresh_terminal_display()  # Forcer le rafraîchissement
-            self.settings.save_setting('theme', theme_name)  # Persistance via JSON
-            logger.info(f"Thème changé: {theme_name}")
-        except Exception as e:
-            logger.error(f"Erreur lors du changement de thème: {e}")
-
-    def apply_terminal_colors(self) -> None:
-        """
-        Applique les couleurs du terminal via ThemeManager.
-        """
-        try:
-            self.theme_manager.apply_theme(self.current_theme)
-        except Exception as e:
-            logger.error(f"Erreur lors de l'application des couleurs: {e}")
-
-    def refresh_terminal_display(self) -> None:
-        """
-        Force la mise à jour visuelle du terminal avec les nouvelles couleurs via ThemeManager.
-        """
-        try:
-            self.theme_manager.refresh_terminal_display(self.current_theme)
-        except Exception as e:
-            logger.error(f"Erreur lors de la mise à jour du terminal: {e}")
-
-    def apply_theme(self, theme_name: str) -> None:
-        """
-        Applique un thème à l'application via ThemeManager.
-        """
-        self.change_theme(theme_name)
-
     def _ultra_flush_buffer(self) -> None:
         """
         Flush ultra-optimisé utilisant le gestionnaire mémoire avancé avec gestion des couleurs.
@@ -889,22 +1138,43 @@ class Terminal(QMainWindow):
             None
         """
         try:
-            if hasattr(self, 'ultra_memory') and hasattr(self, 'terminal_output'):
-                if self.terminal_output and hasattr(self, '_color_buffer'):
+            self._drain_rx_buffer()
+            # Rien à afficher (flush déjà fait par le chemin singleShot, paquet
+            # entièrement filtré) : pas de cycle setUpdatesEnabled, donc pas de repaint
+            if not self._pending_text_buffer and not self._run_size:
+                return
+            # ultra_memory et terminal_output sont initialisés dans __init__
+            if self.terminal_output:
+                # Un seul bloc d'édition : Qt regroupe la mise en page et les
+                # signaux contentsChange/textChanged en une notification par flush
+                # Pas de repaint pendant les insertions : un seul à la réactivation
+                edit_cursor = self._end_cursor
+                self.terminal_output.setUpdatesEnabled(False)
+                edit_cursor.beginEditBlock()
+                try:
                     # Flush le buffer texte via le gestionnaire mémoire ultra
                     self.ultra_memory.flush_buffer(self.terminal_output)
-                    
-                    # Nettoyer le buffer des couleurs
-                    if hasattr(self, '_color_buffer'):
-                        self._color_buffer.clear()
-                    
-                    # Vérifier et nettoyer si nécessaire
-                    stats = self.ultra_memory.get_memory_stats()
-                    if stats['current_objects'] > 40:
-                        logger.warning(f"Trop d'objets en mémoire: {stats['current_objects']}")
+                    # Afficher le texte en attente, regroupé par couleur
+                    self._flush_text_buffer()
+                finally:
+                    edit_cursor.endEditBlock()
+                    self.terminal_output.setUpdatesEnabled(True)
+                # Suivi de la fin après endEditBlock : la mise en page et la plage de
+                # la barre de défilement sont alors à jour pour ensureCursorVisible.
+                # Ne pas écraser une sélection en cours de l'utilisateur
+                if not self._has_selection:
+                    self.terminal_output.setTextCursor(edit_cursor)
+                    self.terminal_output.ensureCursorVisible()
+                
+                # Vérifier et nettoyer si nécessaire, une fois tous les 256 flushs
+                self._flush_tick = (self._flush_tick + 1) & 0xFF
+                if self._flush_tick == 0:
+                    object_count = self.ultra_memory.object_count
+                    if object_count > 40:
+                        logger.warning("Trop d'objets en mémoire: %s", object_count)
                         self.ultra_memory.emergency_cleanup()
         except Exception as e:
-            logger.error(f"Erreur dans _ultra_flush_buffer: {e}")
+            logger.error("Erreur dans _ultra_flush_buffer: %s", e)
 
     def toggle_send_panel_visibility(self) -> None:
         """
@@ -915,17 +1185,37 @@ class Terminal(QMainWindow):
             new_visible = not is_visible
             self.input_panel.setVisible(new_visible)
             # Synchroniser la case à cocher avec la visibilité réelle
-            if self.toggle_send_panel_action:
-                self.toggle_send_panel_action.setChecked(new_visible)
-                if new_visible:
-                    self.toggle_send_panel_action.setText('Masquer le panneau d\'envoi')
-                else:
-                    self.toggle_send_panel_action.setText('Afficher le panneau d\'envoi')
-            # Sauvegarder les paramètres
-            self.save_settings()
-            logger.info(f"Panneau d'envoi {'affiché' if new_visible else 'masqué'}")
+            self._sync_send_panel_action(new_visible)
+            # La visibilité est persistée par save_settings() dans closeEvent
+            logger.info("Panneau d'envoi %s", 'affiché' if new_visible else 'masqué')
         except Exception as e:
-            logger.error(f"Erreur lors du basculement du panneau d'envoi: {str(e)}")
+            logger.error("Erreur lors du basculement du panneau d'envoi: %s", e)
+
+    def _sync_send_panel_action(self, visible: bool) -> None:
+        """
+        Aligne l'état et le libellé de l'action du panneau d'envoi, sans réémettre ses signaux.
+        Args:
+            visible (bool): Visibilité du panneau d'envoi.
+        """
+        action = self.toggle_send_panel_action
+        if not action:
+            return
+        blocker = QSignalBlocker(action)
+        action.setChecked(visible)
+        action.setText(self._HIDE_SEND_PANEL_LABEL if visible else self._SHOW_SEND_PANEL_LABEL)
+        blocker.unblock()
+
+    def _sync_settings_tab_action(self, visible: bool) -> None:
+        """
+        Aligne l'état et le libellé de l'action de l'onglet paramètres, sans réémettre ses signaux.
+        Args:
+            visible (bool): Visibilité de l'onglet paramètres.
+        """
+        action = self.toggle_settings_tab_action
+        blocker = QSignalBlocker(action)
+        action.setChecked(visible)
+        action.setText(self._HIDE_SETTINGS_TAB_LABEL if visible else self._SHOW_SETTINGS_TAB_LABEL)
+        blocker.unblock()
 
     def toggle_settings_tab_visibility(self) -> None:
         """
@@ -935,22 +1225,19 @@ class Terminal(QMainWindow):
             if self.settings_tab_visible and self.settings_tab_index is not None:
                 # Masquer l'onglet des paramètres
                 self.tab_widget.removeTab(self.settings_tab_index)
-                self.toggle_settings_tab_action.setText('Afficher l\'onglet paramètres')
-                self.toggle_settings_tab_action.setChecked(False)
+                self._sync_settings_tab_action(False)
                 self.settings_tab_visible = False
                 self.settings_tab_index = None
                 logger.info("Onglet paramètres masqué")
             else:
                 # Afficher l'onglet des paramètres
                 self.settings_tab_index = self.tab_widget.addTab(self.advanced_panel, "⚙️ Paramètres")
-                self.toggle_settings_tab_action.setText('Masquer l\'onglet paramètres')
-                self.toggle_settings_tab_action.setChecked(True)
+                self._sync_settings_tab_action(True)
                 self.settings_tab_visible = True
                 logger.info("Onglet paramètres affiché")
-            # Sauvegarder les paramètres
-            self.save_settings()
+            # La visibilité est persistée par save_settings() dans closeEvent
         except Exception as e:
-            logger.error(f"Erreur lors du basculement de l'onglet paramètres: {str(e)}")
+            logger.error("Erreur lors du basculement de l'onglet paramètres: %s", e)
 
     def reset_config(self) -> None:
         """
@@ -958,17 +1245,16 @@ class Terminal(QMainWindow):
         """
         try:
             self.change_theme('sombre')
-            self.terminal_output.setFont(QFont("Consolas", 10))
+            self._set_terminal_font(self._default_font())
             if self.settings_tab_visible and self.settings_tab_index is not None:
                 self.tab_widget.removeTab(self.settings_tab_index)
                 self.settings_tab_visible = False
                 self.settings_tab_index = None
-                self.toggle_settings_tab_action.setChecked(False)
-                self.toggle_settings_tab_action.setText('Afficher l\'onglet paramètres')
-            self.save_settings()
+                self._sync_settings_tab_action(False)
+            self._schedule_save_settings()
             logger.info("Apparence réinitialisée (thème sombre, police par défaut, onglet paramètres masqué)")
         except Exception as e:
-            logger.error(f"Erreur lors de la réinitialisation de l'apparence: {e}")
+            logger.error("Erreur lors de la réinitialisation de l'apparence: %s", e)
 
     def setupShortcuts(self) -> None:
         """
@@ -979,54 +1265,107 @@ class Terminal(QMainWindow):
     def clear_terminal(self) -> None:
         """
         Efface le contenu du terminal.
-        """
-        if hasattr(self, 'terminal_output') and self.terminal_output:
-            self.terminal_output.clear()
+        Tout l'état de réception en attente est remis à zéro dans le même appel,
+        afin qu'un flush déjà programmé ne réaffiche pas des données antérieures.
+        """
+        self._ultra_flush_timer.stop()
+        self._rx_flush_scheduled = False
+        self._rx_used = 0
+        self._rx_decoder.reset()
+        self._pending_text_buffer.clear()
+        self._reset_text_run()
+        if self.terminal_output is not None:
+            # Un seul repaint, le document (et sa limite de blocs) est conservé
+            self.terminal_output.setUpdatesEnabled(False)
+            try:
+                self.terminal_output.document().clear()
+            finally:
+                self.terminal_output.setUpdatesEnabled(True)
         else:
             logger.warning("terminal_output absent lors de l'effacement")
 
     def change_font(self) -> None:
         """
         Ouvre une boîte de dialogue pour choisir la police du terminal.
-        """
-        from PyQt5.QtWidgets import QFontDialog
-        if hasattr(self, 'terminal_output') and self.terminal_output:
-            font, ok = QFontDialog.getFont(self.terminal_output.font(), self, "Choisir la police du terminal")
-            if ok:
-                self.terminal_output.setFont(font)
+        La boîte est conservée entre deux appels (pas de reconstruction de la liste des polices).
+        """
+        if self.terminal_output is not None:
+            if self._font_dialog is None:
+                self._font_dialog = QFontDialog(self)
+                self._font_dialog.setWindowTitle("Choisir la police du terminal")
+            self._font_dialog.setCurrentFont(self.terminal_output.font())
+            if self._font_dialog.exec_():
+                self._set_terminal_font(self._font_dialog.selectedFont())
         else:
             logger.warning("terminal_output absent lors du changement de police")
 
+    def set_line_wrap(self, enabled: bool) -> None:
+        """
+        Active ou désactive le retour à la ligne automatique du terminal.
+        Args:
+            enabled (bool): True pour couper les lignes à la largeur du widget.
+        """
+        if self.terminal_output is None:
+            logger.warning("terminal_output absent lors du changement de retour à la ligne")
+            return
+        self.terminal_output.setLineWrapMode(QPlainTextEdit.WidgetWidth if enabled else QPlainTextEdit.NoWrap)
+
+    @classmethod
+    def _default_font(cls) -> QFont:
+        """
+        Retourne la police par défaut du terminal (Consolas 10), partagée entre les appels.
+        L'indication Monospace oriente directement la résolution vers une police à chasse
+        fixe lorsque Consolas est absente (Linux, macOS).
+        Returns:
+            QFont: Police par défaut.
+        """
+        if cls._DEFAULT_FONT is None:
+            font = QFont("Consolas", 10)
+            font.setStyleHint(QFont.Monospace)
+            cls._DEFAULT_FONT = font
+        return cls._DEFAULT_FONT
+
+    def _set_terminal_font(self, font: QFont) -> None:
+        """
+        Applique une police au terminal et mémorise sa description pour save_settings.
+        Args:
+            font (QFont): Police à appliquer.
+        """
+        self.terminal_output.setFont(font)
+        self._terminal_font_data = {'family': font.family(), 'size': font.pointSize()}
+
     def show_checksum_calculator(self) -> None:
         """
         Affiche la fenêtre du calculateur de checksum.
         """
-        if hasattr(self, 'checksum_calculator') and self.checksum_calculator:
-            self.checksum_calculator.show()
-            self.checksum_calculator.raise_()
-            self.checksum_calculator.activateWindow()
-        else:
+        window = self.checksum_calculator
+        if window is None:
             logger.error("ChecksumCalculator non instancié")
+            return
+        window.show()
+        window.raise_()
+        window.activateWindow()
 
     def show_data_converter(self) -> None:
         """
         Affiche la fenêtre du convertisseur de données.
         """
-        if hasattr(self, 'data_converter') and self.data_converter:
-            self.data_converter.show()
-            self.data_converter.raise_()
-            self.data_converter.activateWindow()
-        else:
+        window = self.data_converter
+        if window is None:
             logger.error("DataConverter non instancié")
+            return
+        window.show()
+        window.raise_()
+        window.activateWindow()
 
     def refresh_ports(self) -> None:
         """
         Rafraîchit la liste des ports série disponibles dans le panneau de connexion.
         """
-        if hasattr(self, 'serial_panel') and self.serial_panel and hasattr(self.serial_panel, 'refresh_ports'):
+        if self.serial_panel is not None:
             self.serial_panel.refresh_ports()
         else:
-            logger.warning("serial_panel ou sa méthode refresh_ports est absente")
+            logger.warning("serial_panel absent lors du rafraîchissement des ports")
 
     def append_text(self, text: str, msg_type: str = 'system') -> None:
         """
@@ -1035,19 +1374,95 @@ class Terminal(QMainWindow):
             text (str): Texte à afficher.
             msg_type (str): Type de message ('system', 'error', 'received', etc.).
         """
-        if not hasattr(self, 'terminal_output') or self.terminal_output is None:
+        # terminal_output est toujours initialisé dans __init__ : pas de hasattr ici
+        if self.terminal_output is None:
             logger.warning("terminal_output absent lors de l'affichage du texte")
             return
-        from PyQt5.QtGui import QTextCursor
-        # Utiliser uniquement insertPlainText pour que la couleur soit gérée par la palette globale
-        # et le setStyleSheet appliqué dans ThemeManager
+        # Le texte est regroupé par couleur puis affiché par _ultra_flush_buffer
+        if msg_type != self._last_color:
+            self._close_text_run()
+            self._last_color = msg_type
+        self._run_write(text)
+        self._run_size += len(text)
+        if self._run_size >= self.RUN_FLUSH_THRESHOLD:
+            self._close_text_run()
+        if not self._flush_timer_active():
+            self._flush_timer_start()
+
+    def _close_text_run(self) -> None:
+        """
+        Clôt le segment de couleur en cours et le place dans le buffer d'affichage.
+        """
+        if self._run_size:
+            self._pending_text_buffer.append((self._run_buffer.getvalue(), self._last_color))
+            self._reset_text_run()
+
+    def _reset_text_run(self) -> None:
+        """
+        Vide le segment de couleur en cours sans l'afficher.
+        """
+        self._run_buffer.seek(0)
+        self._run_buffer.truncate()
+        self._run_size = 0
+
+    def _on_terminal_selection_changed(self) -> None:
+        """
+        Mémorise si l'utilisateur a du texte sélectionné dans le terminal.
+        """
+        self._has_selection = self.terminal_output.textCursor().hasSelection()
+
+    def _build_format(self, color: str) -> QTextCharFormat:
+        """
+        Construit le format de texte d'un type de message pour le thème courant.
+        Si la couleur est celle du texte par défaut, le format reste vide afin que
+        la palette globale et le setStyleSheet du ThemeManager gardent la main.
+        Args:
+            color (str): Type de message ('system', 'error', 'received', etc.).
+        Returns:
+            QTextCharFormat: Format à appliquer au texte inséré.
+        """
+        format_obj = QTextCharFormat()
+        theme_colors = get_theme_terminal_colors(self.current_theme)
+        if color in theme_colors and theme_colors[color] != theme_colors['text']:
+            format_obj.setForeground(theme_colors[color])
+        return format_obj
+
+    def _build_active_formats(self) -> None:
+        """
+        Construit la table type de message -> format pour le thème courant,
+        afin que le flush ne fasse plus qu'une lecture dans un petit dictionnaire.
+        """
+        build = self._build_format
+        self._active_formats = {color: build(color) for color in self.MESSAGE_TYPES}
+
+    def _flush_text_buffer(self) -> None:
+        """
+        Insère dans le terminal tout le texte en attente, en une seule passe de curseur.
+        Chaque segment de couleur est inséré tel quel par un seul insertText, avec le
+        format en cache du thème. Le défilement est laissé à l'appelant, une fois le
+        bloc d'édition fermé (voir _ultra_flush_buffer).
+        """
+        self._close_text_run()
+        if not self._pending_text_buffer or self.terminal_output is None:
+            return
         try:
-            cursor = self.terminal_output.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            cursor.insertText(text)
-            self.terminal_output.setTextCursor(cursor)
-            self.terminal_output.ensureCursorVisible()
+            cursor = self._end_cursor
+            # Le curseur persistant est normalement déjà en fin de document
+            if not cursor.atEnd():
+                cursor.movePosition(_CURSOR_END)
+            # Liaisons locales pour la boucle (évite les LOAD_ATTR répétés)
+            formats = self._active_formats
+            build = self._build_format
+            insert = self._insert_text
+            for text, color in self._pending_text_buffer:
+                fmt = formats.get(color)
+                if fmt is None:
+                    fmt = formats.setdefault(color, build(color))
+                # Format du thème passé directement : pas de setCharFormat sur le curseur
+                insert(text, fmt)
         except Exception as e:
-            logger.error(f"Erreur lors de l'affichage du texte dans le terminal: {e}")
+            logger.error("Erreur lors de l'affichage du texte dans le terminal: %s", e)
+        finally:
+            self._pending_text_buffer.clear()
 
 __all__ = ["Terminal", "SendWorker"]
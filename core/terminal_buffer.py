@@ -12,7 +12,7 @@ Rôle :
 
 Fonctionnalités principales :
     - Buffer circulaire et historique des textes
-    - Gestion des couleurs et du formatage
+    - Suivi du thème courant (les couleurs viennent de la palette globale)
     - Optimisation mémoire et flush intelligent
     - Intégration avec PyQt5
 
@@ -29,90 +29,92 @@ Auteur :
 """
 
 import logging
-from typing import List, Any
-from PyQt5.QtGui import QTextCharFormat, QColor
+from collections import deque
+from typing import List, Deque, Tuple
+from PyQt5.QtCore import QTimer
 
 logger = logging.getLogger("CrazySerialTerm.TerminalBuffer")
 
+# Délai de regroupement des ajouts avant affichage (ms, une image à 60 Hz)
+_FLUSH_DELAY_MS = 16
+
 class TerminalBufferManager:
     """
     Gère le buffer, le flush, la mémoire et les couleurs du terminal.
+    La taille du terminal (QPlainTextEdit) est bornée par son maximumBlockCount :
+    Qt retire lui-même les lignes les plus anciennes à l'insertion.
     """
-    def __init__(self, terminal_output, max_chars=30000, theme='sombre'):
+    def __init__(self, terminal_output, max_lines=5000, theme='sombre'):
         self.terminal_output = terminal_output
-        self._color_buffer: List[str] = []
-        self._text_format_cache = {}
-        self._pending_text_buffer: List[Any] = []
-        self._max_terminal_chars = max_chars
+        # Entrées (texte, type de message) : tuples, moins coûteux qu'un dict par ligne
+        self._pending_text_buffer: List[Tuple[str, str]] = []
+        self._max_lines = max_lines
+        # Limite posée seulement si le propriétaire du widget n'en a pas déjà fixé une
+        if terminal_output is not None and terminal_output.maximumBlockCount() == 0:
+            terminal_output.setMaximumBlockCount(max_lines)
         self.current_theme = theme
         self._cursor_pool = None
-        self._last_cursor_position = 0
         self._object_creation_count = 0
-        self._history: List[dict[str, str]] = []  # Buffer historique (texte + type)
+        # Buffer historique (texte + type), borné comme le terminal lui-même
+        self._history: Deque[Tuple[str, str]] = deque(maxlen=max_lines)
+        # Flush différé : une rafale de lignes est affichée en une seule fois
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush)
 
     def append_text(self, text: str, color: str = 'text') -> None:
         if not text.endswith('\n'):
             text += '\n'
-        self._pending_text_buffer.append((text, color))
-        self._color_buffer.append(color)
-        self._history.append({'text': text, 'color': color})  # Ajout à l'historique
-        self.flush()  # Affichage immédiat
+        entry = (text, color)
+        self._pending_text_buffer.append(entry)
+        self._history.append(entry)  # Ajout à l'historique (même tuple, pas de copie)
+        # Affichage différé (au plus ~60 flushs/s) : le timer n'est pas réarmé s'il tourne déjà
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def force_flush(self) -> None:
+        """
+        Affiche immédiatement le texte en attente et arrête le timer (fermeture de la fenêtre).
+        """
+        self._flush_timer.stop()
+        self.flush()
 
     def flush(self) -> None:
         if not self._pending_text_buffer or not self.terminal_output:
             return
         try:
-            if not self._cursor_pool:
+            if self._cursor_pool is None:
                 self._cursor_pool = self.terminal_output.textCursor()
             cursor = self._cursor_pool
-            cursor.movePosition(cursor.End)
+            # Le curseur conservé reste en fin de document après chaque insertion
+            if not cursor.atEnd():
+                cursor.movePosition(cursor.End)
+            # Suivre la fin seulement si l'utilisateur y est déjà (mesuré avant insertion)
+            scrollbar = self.terminal_output.verticalScrollBar()
+            at_bottom = scrollbar.value() == scrollbar.maximum()
             cursor.beginEditBlock()
             
-            # N'utilise PAS de QTextCharFormat - laisse la palette globale agir
-            for text, color in self._pending_text_buffer:
-                cursor.insertText(text)
-                self._object_creation_count += 1
+            # N'utilise PAS de QTextCharFormat - laisse la palette globale agir :
+            # tout le texte en attente est donc inséré en un seul insertText
+            cursor.insertText("".join([text for text, _ in self._pending_text_buffer]))
+            self._object_creation_count += 1
             
             cursor.endEditBlock()
-            self._last_cursor_position = cursor.position()
-            self.terminal_output.setTextCursor(cursor)
-            self.terminal_output.ensureCursorVisible()
+            if at_bottom:
+                self.terminal_output.setTextCursor(cursor)
+                self.terminal_output.ensureCursorVisible()
             self._pending_text_buffer.clear()
-            self._color_buffer.clear()
         except Exception as e:
-            logger.error(f"Erreur dans flush: {e}")
+            logger.error("Erreur dans flush: %s", e)
             self._pending_text_buffer.clear()
-            self._color_buffer.clear()
-
-    def get_cached_format(self, color: str) -> QTextCharFormat:
-        # Utilise la couleur du thème courant pour chaque type de message
-        from interface.theme_manager import get_theme_terminal_colors
-        theme_colors = get_theme_terminal_colors(self.current_theme)
-        cache_key = f"{self.current_theme}_{color}"
-        if cache_key not in self._text_format_cache:
-            format_obj = QTextCharFormat()
-            # Utilise la couleur du thème si connue, sinon blanc/noir par défaut
-            if color in theme_colors:
-                format_obj.setForeground(theme_colors[color])
-            else:
-                # fallback
-                if self.current_theme == 'clair':
-                    format_obj.setForeground(QColor(0, 0, 0))
-                elif self.current_theme == 'hacker':
-                    format_obj.setForeground(QColor(0, 255, 0))
-                else:
-                    format_obj.setForeground(QColor(255, 255, 255))
-            self._text_format_cache[cache_key] = format_obj
-        return self._text_format_cache[cache_key]
 
     def clear(self):
+        self._flush_timer.stop()
         if self.terminal_output:
             self.terminal_output.clear()
         self._pending_text_buffer.clear()
-        self._color_buffer.clear()
-        self._text_format_cache.clear()
         self._cursor_pool = None
-        self._last_cursor_position = 0
         self._object_creation_count = 0
 
     def aggressive_cleanup(self):
@@ -135,11 +137,16 @@ class TerminalBufferManager:
         """
         if not self.terminal_output:
             return
+        # Ne suivre la fin que si l'utilisateur est déjà en bas du terminal
+        scrollbar = self.terminal_output.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
         cursor = self.terminal_output.textCursor()
         cursor.movePosition(cursor.End)
         cursor.insertText(text)
-        self.terminal_output.setTextCursor(cursor)
-        self.terminal_output.ensureCursorVisible()
+        # setTextCursor fait lui-même défiler la vue : réservé au cas où l'on suit la fin
+        if at_bottom:
+            self.terminal_output.setTextCursor(cursor)
+            self.terminal_output.ensureCursorVisible()
 
     def set_theme(self, theme_name: str):
         """
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Module : terminal_clean_numba.py
+
+Outil interne CrazyTerm : Nettoyage accéléré des données reçues (optionnel, chargé dynamiquement)
+
+Rôle :
+    Fournit une version compilée (Numba) du nettoyage des octets reçus sur le port série,
+    appliquée avant le décodage UTF-8. Le module n'est importable que si numpy et numba
+    sont installés ; sinon la fenêtre principale garde le nettoyage Python.
+
+Fonctionnalités principales :
+    - Suppression de backspace et delete, puis des séquences ANSI ESC[...m / ESC[...K
+      et des escape isolés (même ordre que le nettoyage Python de la fenêtre principale)
+    - '←' est retiré après décodage par l'appelant (caractère éventuellement coupé
+      entre deux lectures)
+    - Noyau compilé en code natif et mis en cache sur disque, compilé (ou rechargé
+      depuis le cache) dès l'import du module et non à la première réception
+
+Dépendances :
+    - numpy
+    - numba
+    - logging
+    - typing
+
+Utilisation :
+    Ce module est importé de manière optionnelle par la fenêtre principale
+    (ImportError si numpy/numba sont absents).
+
+Auteur :
+    Projet CrazyTerm (2025) Manu
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Union
+
+import numpy as np
+from numba import njit
+
+__all__ = ["clean_bytes"]
+
+logger = logging.getLogger("CrazySerialTerm")
+
+# Octets traités par le noyau
+_ESC = 0x1b
+_BACKSPACE = 0x08
+_DELETE = 0x7f
+_CSI_OPEN = 0x5b  # '['
+_SGR_END = 0x6d  # 'm'
+_EL_END = 0x4b  # 'K'
+_SEMICOLON = 0x3b
+
+
+@njit(cache=True)
+def _clean_kernel(src: np.ndarray, out: np.ndarray) -> int:
+    """
+    Copie dans out les octets de src à conserver.
+    Deux passes, comme le chemin Python : backspace/delete d'abord (ils peuvent se
+    trouver au milieu d'une séquence ANSI), puis séquences ANSI et escape isolés,
+    sur place dans out.
+    Args:
+        src (np.ndarray): Octets reçus (uint8).
+        out (np.ndarray): Buffer de sortie de même taille que src.
+    Returns:
+        int: Nombre d'octets écrits dans out.
+    """
+    # Passe 1 : backspace et delete
+    n = 0
+    for i in range(src.shape[0]):
+        b = src[i]
+        if b != _BACKSPACE and b != _DELETE:
+            out[n] = b
+            n += 1
+    # Passe 2 : séquences ANSI et escape isolés (j <= i : réécriture sur place sûre)
+    i = 0
+    j = 0
+    while i < n:
+        b = out[i]
+        if b == _ESC:
+            # Séquence CSI complète ESC [ chiffres/; (m|K) : supprimée en entier
+            if i + 1 < n and out[i + 1] == _CSI_OPEN:
+                k = i + 2
+                while k < n and ((0x30 <= out[k] <= 0x39) or out[k] == _SEMICOLON):
+                    k += 1
+                if k < n and (out[k] == _SGR_END or out[k] == _EL_END):
+                    i = k + 1
+                    continue
+            # Escape isolé : seul l'octet ESC est supprimé
+            i += 1
+            continue
+        out[j] = b
+        j += 1
+        i += 1
+    return j
+
+
+def clean_bytes(buf: Union[bytes, bytearray]) -> bytes:
+    """
+    Nettoie les octets reçus avec le noyau compilé.
+    Résultat identique octet pour octet à la version Python (_clean_rx_bytes de
+    core.main_window), vérifié par dev_tools/quality_validator.py ; '←' est retiré
+    après décodage par l'appelant (voir Terminal._decode_rx).
+    Args:
+        buf (bytes | bytearray): Octets reçus.
+    Returns:
+        bytes: Octets nettoyés, prêts à être décodés.
+    """
+    try:
+        src = np.frombuffer(buf, dtype=np.uint8)
+        out = np.empty_like(src)
+        kept = _clean_kernel(src, out)
+        return out[:kept].tobytes()
+    except Exception as e:
+        logger.error("Erreur lors du nettoyage accéléré des données reçues: %s", e)
+        raise
+
+
+# Compilation à l'import (chargement de la fenêtre principale) plutôt qu'au premier
+# lot reçu, dans le slot de réception du thread GUI. Un échec de compilation est
+# signalé comme ImportError : la fenêtre principale garde alors le nettoyage Python
+try:
+    _clean_kernel(np.zeros(1, dtype=np.uint8), np.empty(1, dtype=np.uint8))
+except Exception as e:
+    raise ImportError(f"Compilation du noyau de nettoyage impossible: {e}") from e
@@ -21,12 +21,52 @@ Dépendances :
 """
 
 import importlib
-import glob
 import logging
-from typing import Dict, Any, Optional, List
+import os
+from typing import Dict, Any, Optional, List, Tuple
+
+from PyQt5.QtWidgets import QDialog
 
 logger = logging.getLogger(__name__)
 
+# Classes d'outils trouvées par introspection, par module : (date de modification du fichier, classe)
+_TOOL_CLASS_CACHE: Dict[str, Tuple[float, type]] = {}
+
+
+def _find_tool_class(module_name: str, module: Any) -> Optional[type]:
+    """
+    Retourne la classe d'outil d'un module : attribut TOOL_CLASS s'il est défini,
+    sinon recherche par dir() mise en cache tant que le fichier du module est inchangé.
+    """
+    tool_class = getattr(module, 'TOOL_CLASS', None)
+    if isinstance(tool_class, type):
+        return tool_class
+    module_file = getattr(module, '__file__', None)
+    try:
+        mtime = os.path.getmtime(module_file) if module_file else 0.0
+    except OSError:
+        mtime = 0.0
+    cached = _TOOL_CLASS_CACHE.get(module_name)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    tool_class = None
+    # 1. Cherche une classe commençant par 'tool'
+    for attr in dir(module):
+        obj = getattr(module, attr)
+        if isinstance(obj, type) and attr.lower().startswith('tool'):
+            tool_class = obj
+            break
+    # 2. Sinon, prend la première classe trouvée
+    if not tool_class:
+        for attr in dir(module):
+            obj = getattr(module, attr)
+            if isinstance(obj, type) and not attr.startswith('__'):
+                tool_class = obj
+                break
+    if tool_class:
+        _TOOL_CLASS_CACHE[module_name] = (mtime, tool_class)
+    return tool_class
+
 
 class ToolManager:
     """Gestionnaire des outils pour CrazyTerm."""
@@ -42,43 +82,33 @@ class ToolManager:
     
     def _load_dynamic_tools(self) -> None:
         """Scanne le dossier tools et importe dynamiquement tous les outils tool_*.py."""
-        import os
         tools_dir = os.path.join(os.path.dirname(__file__), '..', 'tools')
-        pattern = os.path.join(tools_dir, 'tool_*.py')
-        for tool_path in glob.glob(pattern):
-            module_name = os.path.splitext(os.path.basename(tool_path))[0]
+        # Un seul parcours du dossier : les noms sont filtrés sans motif glob ni stat supplémentaire
+        try:
+            with os.scandir(tools_dir) as entries:
+                module_names = [entry.name[:-3] for entry in entries
+                                if entry.name.startswith('tool_') and entry.name.endswith('.py')]
+        except OSError as e:
+            logger.warning("Dossier des outils inaccessible (%s): %s", tools_dir, e)
+            return
+        for module_name in module_names:
             try:
                 module = importlib.import_module(f'tools.{module_name}')
-                tool_class = None
-                # 1. Cherche une classe commençant par 'tool'
-                for attr in dir(module):
-                    obj = getattr(module, attr)
-                    if isinstance(obj, type) and attr.lower().startswith('tool'):
-                        tool_class = obj
-                        break
-                # 2. Sinon, prend la première classe trouvée
-                if not tool_class:
-                    for attr in dir(module):
-                        obj = getattr(module, attr)
-                        if isinstance(obj, type) and not attr.startswith('__'):
-                            tool_class = obj
-                            break
+                tool_class = _find_tool_class(module_name, module)
                 if tool_class:
-                    # Import ici pour éviter les cycles
-                    from PyQt5.QtWidgets import QDialog
                     if issubclass(tool_class, QDialog):
                         instance = tool_class(self.parent) if self.parent else tool_class()
                     else:
                         instance = tool_class()
                     self.register_tool(module_name, instance)
-                    logger.info(f"Outil dynamique chargé: {module_name}")
+                    logger.info("Outil dynamique chargé: %s", module_name)
             except Exception as e:
-                logger.warning(f"Échec chargement outil {module_name}: {e}")
+                logger.warning("Échec chargement outil %s: %s", module_name, e)
     
     def register_tool(self, name: str, tool: Any) -> None:
         """Enregistre un outil."""
         self.tools[name] = tool
-        logger.debug(f"Outil '{name}' enregistré")
+        logger.debug("Outil '%s' enregistré", name)
     
     def get_tool(self, name: str) -> Optional[Any]:
         """Récupère un outil par son nom."""
@@ -89,7 +119,7 @@ class ToolManager:
         if name in self.tools:
             if name not in self.active_tools:
                 self.active_tools.append(name)
-            logger.info(f"Outil '{name}' activé")
+            logger.info("Outil '%s' activé", name)
             return True
         return False
     
@@ -97,7 +127,7 @@ class ToolManager:
         """Désactive un outil."""
         if name in self.active_tools:
             self.active_tools.remove(name)
-            logger.info(f"Outil '{name}' désactivé")
+            logger.info("Outil '%s' désactivé", name)
             return True
         return False
     
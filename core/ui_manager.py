@@ -22,7 +22,7 @@ Dépendances :
 
 import logging
 from typing import Optional, Dict, Any
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +50,7 @@ class UIManager:
     def add_widget(self, name: str, widget: QWidget) -> None:
         """Ajoute un widget à la gestion."""
         self.widgets[name] = widget
-        logger.debug(f"Widget '{name}' ajouté à UIManager")
+        logger.debug("Widget '%s' ajouté à UIManager", name)
     
     def get_widget(self, name: str) -> Optional[QWidget]:
         """Récupère un widget par son nom."""
@@ -58,7 +58,7 @@ class UIManager:
     
     def apply_theme(self, theme_name: str) -> None:
         """Applique un thème à l'interface."""
-        logger.info(f"Thème '{theme_name}' appliqué")
+        logger.info("Thème '%s' appliqué", theme_name)
     
     def __str__(self) -> str:
         """Retourne une représentation string de l'UIManager."""
@@ -20,6 +20,7 @@ License: MIT
 
 import sys
 import os
+import gc
 import logging
 from PyQt5.QtWidgets import QApplication, QStyleFactory
 from PyQt5.QtGui import QIcon, QFont
@@ -104,30 +105,38 @@ def main() -> None:
     logger.info("Démarrage de CrazySerialTerm")
     
     try:
+        # GC générationnel moins fréquent : l'application alloue surtout des objets
+        # de courte durée sans cycles (chaînes, octets reçus)
+        gc.set_threshold(100_000, 50, 50)
+        
         # Configuration de l'application
         app = setup_application()
         
         # Créer et afficher la fenêtre principale
         terminal = Terminal()
         
+        # Interface construite et paramètres chargés : ces objets vivent jusqu'à la
+        # fermeture, ils sont sortis des passes du GC
+        gc.freeze()
+        
         # Charger l'icône de l'application
         icon_path: str = UtilityFunctions.resource_path('assets/CrazyTerm.ico')
         if os.path.exists(icon_path):
             terminal.setWindowIcon(QIcon(icon_path))
-            logger.debug(f"Icône chargée depuis: {icon_path}")
+            logger.debug("Icône chargée depuis: %s", icon_path)
         else:
-            logger.warning(f"Icône non trouvée: {icon_path}")
+            logger.warning("Icône non trouvée: %s", icon_path)
         
         # Exécuter l'application
         sys.exit(app.exec_())
         
     except ImportError as e:
-        logger.critical(f"Dépendance manquante: {str(e)}")
+        logger.critical("Dépendance manquante: %s", e)
         print(f"ERREUR: Dépendance manquante - {str(e)}")
         print("Veuillez installer les dépendances avec: pip install -r requirements.txt")
         sys.exit(1)
     except Exception as e:
-        logger.critical(f"Erreur critique lors du démarrage: {str(e)}", exc_info=True)
+        logger.critical("Erreur critique lors du démarrage: %s", e, exc_info=True)
         print(f"ERREUR CRITIQUE: {str(e)}")
         sys.exit(1)
 
@@ -25,9 +25,14 @@ Auteur :
     Projet CrazyTerm (2025) Manu
 """
 
+import io
 import os
 import sys
+import hashlib
 import subprocess
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, TextIO, Tuple
 
 # Patch pour forcer l'encodage UTF-8 sur la sortie standard si nécessaire
 if sys.stdout.encoding is not None and sys.stdout.encoding.lower() != 'utf-8':
@@ -36,19 +41,114 @@ if sys.stdout.encoding is not None and sys.stdout.encoding.lower() != 'utf-8':
     except AttributeError:
         pass  # Pour compatibilité Python <3.7
 
-def check_command(cmd: str, success_msg: str, fail_msg: str) -> bool:
+def check_command(cmd: str, success_msg: str, fail_msg: str, out: Optional[TextIO] = None) -> bool:
     """
     Exécute une commande système et affiche un message selon le résultat.
+    Les messages vont dans out (sortie standard par défaut).
     Retourne True si succès, False sinon.
     """
     try:
         _ = subprocess.run(cmd, shell=True, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        print(f"✅ {success_msg}")
+        print(f"✅ {success_msg}", file=out)
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ {fail_msg}\n{e.stderr.decode(errors='ignore')}")
+        print(f"❌ {fail_msg}\n{e.stderr.decode(errors='ignore')}", file=out)
         return False
 
+# Empreinte du dernier requirements.txt installé avec succès (dans dev_tools/)
+REQUIREMENTS_HASH_FILE = ".reqs.sha256"
+
+def is_module_installed(module_name: str) -> bool:
+    """
+    Indique si un module est importable dans l'interpréteur courant, sans l'importer.
+    """
+    return importlib.util.find_spec(module_name) is not None
+
+def ensure_installed(module_name: str, package: str, label: str, out: Optional[TextIO] = None) -> bool:
+    """
+    Installe un paquet via pip seulement si son module n'est pas déjà disponible.
+    Retourne True si le module est (ou a été rendu) disponible, False sinon.
+    """
+    if is_module_installed(module_name):
+        print(f"✅ {label} déjà installé", file=out)
+        return True
+    return check_command(
+        f"{sys.executable} -m pip install {package}",
+        f"{label} installé",
+        f"Erreur installation {label}",
+        out
+    )
+
+def requirements_fingerprint(requirements_path: str) -> str:
+    """
+    Calcule l'empreinte SHA-256 du fichier requirements pour l'interpréteur courant
+    (un nouvel environnement virtuel invalide donc l'empreinte mémorisée).
+    """
+    digest = hashlib.sha256(sys.executable.encode('utf-8'))
+    with open(requirements_path, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+def read_stored_fingerprint(hash_path: str) -> str:
+    """
+    Lit l'empreinte mémorisée lors de la dernière installation réussie ('' si absente).
+    """
+    try:
+        with open(hash_path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+def check_outdated_dependencies(out: TextIO) -> bool:
+    """
+    Étape 2 : liste les dépendances obsolètes.
+    Retourne True si la vérification a pu être faite.
+    """
+    print("\n{:^60}\n".format("DÉPENDANCES (OBSOLESCENCE)"), file=out)
+    print("-"*60, file=out)
+    return check_command(
+        f"{sys.executable} -m pip list --outdated",
+        "Vérification des dépendances (obsolètes listées ci-dessus)",
+        "Erreur lors de la vérification des dépendances",
+        out
+    )
+
+def check_dependency_security(out: TextIO, install_ok: bool, install_report: str) -> bool:
+    """
+    Étape 3 : audit de sécurité des dépendances avec pip-audit.
+    pip-audit est installé au préalable par main() (install_ok, install_report), hors
+    des étapes parallèles : cette étape n'exécute qu'une commande en lecture seule.
+    Retourne True si pip-audit est disponible et ne signale rien.
+    """
+    print("\n{:^60}\n".format("SÉCURITÉ DES DÉPENDANCES"), file=out)
+    print("-"*60, file=out)
+    print(install_report, end="", file=out)
+    ok = install_ok
+    ok2 = check_command(
+        f"{sys.executable} -m pip_audit",
+        "Audit sécurité pip-audit OK (voir ci-dessus)",
+        "Vulnérabilités détectées ou erreur pip-audit",
+        out
+    )
+    return ok and ok2
+
+def check_documentation(project_root: str, out: TextIO) -> bool:
+    """
+    Étape 4 : vérifie la présence du README et du CHANGELOG.
+    Retourne True si les deux sont présents.
+    """
+    print("\n{:^60}\n".format("DOCUMENTATION"), file=out)
+    print("-"*60, file=out)
+    docs_ok = True
+    for doc in ["README.md", "CHANGELOG.md"]:
+        doc_path: str = os.path.join(project_root, doc)
+        if os.path.exists(doc_path):
+            print(f"✅ {doc} présent", file=out)
+        else:
+            print(f"❌ {doc} manquant", file=out)
+            docs_ok = False
+    return docs_ok
+
 def main() -> None:
     """
     Exécute la checklist automatisée de pré-build pour CrazyTerm.
@@ -72,56 +172,33 @@ def main() -> None:
     )
     steps.append(("Qualité du code", ok))
     all_ok &= ok
-    # 2. Vérification dépendances à jour
-    print("\n{:^60}\n".format("DÉPENDANCES (OBSOLESCENCE)"))
-    print("-"*60)
-    ok = check_command(
-        f"{sys.executable} -m pip list --outdated",
-        "Vérification des dépendances (obsolètes listées ci-dessus)",
-        "Erreur lors de la vérification des dépendances"
-    )
-    steps.append(("Dépendances obsolètes", ok))
-    all_ok &= ok
-    # 3. Vérification sécurité (pip-audit)
-    print("\n{:^60}\n".format("SÉCURITÉ DES DÉPENDANCES"))
-    print("-"*60)
-    ok = check_command(
-        f"{sys.executable} -m pip install pip-audit",
-        "pip-audit installé",
-        "Erreur installation pip-audit"
-    )
-    all_ok &= ok
-    ok2 = check_command(
-        f"{sys.executable} -m pip_audit",
-        "Audit sécurité pip-audit OK (voir ci-dessus)",
-        "Vulnérabilités détectées ou erreur pip-audit"
-    )
-    steps.append(("Sécurité des dépendances", ok and ok2))
-    all_ok &= ok2
-    # 4. Vérification README et CHANGELOG
-    print("\n{:^60}\n".format("DOCUMENTATION"))
-    print("-"*60)
-    docs_ok = True
-    for doc in ["README.md", "CHANGELOG.md"]:
-        doc_path: str = os.path.join(project_root, doc)
-        if os.path.exists(doc_path):
-            print(f"✅ {doc} présent")
-        else:
-            print(f"❌ {doc} manquant")
-            docs_ok = False
-    steps.append(("Documentation", docs_ok))
-    all_ok &= docs_ok
+    # 2 à 4. Dépendances obsolètes, sécurité et documentation : indépendantes et
+    # surtout réseau, exécutées en parallèle ; sorties affichées dans l'ordre des étapes.
+    # Installation de pip-audit d'abord, seule : deux pip concurrents sur le même
+    # site-packages ne sont pas fiables, les étapes parallèles ne font que lire
+    audit_install_out = io.StringIO()
+    audit_install_ok = ensure_installed("pip_audit", "pip-audit", "pip-audit", audit_install_out)
+    parallel_steps: List[Tuple[str, Callable[[TextIO], bool]]] = [
+        ("Dépendances obsolètes", check_outdated_dependencies),
+        ("Sécurité des dépendances",
+         lambda out: check_dependency_security(out, audit_install_ok, audit_install_out.getvalue())),
+        ("Documentation", lambda out: check_documentation(project_root, out)),
+    ]
+    buffers: List[io.StringIO] = [io.StringIO() for _ in parallel_steps]
+    with ThreadPoolExecutor(max_workers=len(parallel_steps)) as executor:
+        futures = [executor.submit(step, buf) for (_, step), buf in zip(parallel_steps, buffers)]
+        for (label, _), future, buf in zip(parallel_steps, futures, buffers):
+            ok = future.result()
+            print(buf.getvalue(), end="")
+            steps.append((label, ok))
+            all_ok &= ok
     # 5. Vérification packaging PyInstaller
     print("\n{:^60}\n".format("PACKAGING (PyInstaller)"))
     print("-"*60)
     crazyterm_path: str = os.path.join(project_root, "crazyterm.py")
     packaging_ok = True
     if os.path.exists(crazyterm_path):
-        ok = check_command(
-            f"{sys.executable} -m pip install pyinstaller",
-            "PyInstaller installé",
-            "Erreur installation PyInstaller"
-        )
+        ok = ensure_installed("PyInstaller", "pyinstaller", "PyInstaller")
         packaging_ok &= ok
         ok = check_command(
             f"{sys.executable} -m PyInstaller --noconfirm --onefile {crazyterm_path}",
@@ -140,12 +217,20 @@ def main() -> None:
     requirements_path: str = os.path.join(project_root, "dev_tools", "requirements.txt")
     req_ok = True
     if os.path.exists(requirements_path):
-        ok = check_command(
-            f"{sys.executable} -m pip install -r {requirements_path}",
-            "Dépendances installées à partir de requirements.txt",
-            "Erreur lors de l'installation des dépendances"
-        )
-        req_ok &= ok
+        hash_path: str = os.path.join(script_dir, REQUIREMENTS_HASH_FILE)
+        fingerprint: str = requirements_fingerprint(requirements_path)
+        if fingerprint == read_stored_fingerprint(hash_path):
+            print("✅ requirements.txt inchangé depuis la dernière installation")
+        else:
+            ok = check_command(
+                f"{sys.executable} -m pip install -r {requirements_path}",
+                "Dépendances installées à partir de requirements.txt",
+                "Erreur lors de l'installation des dépendances"
+            )
+            if ok:
+                with open(hash_path, 'w', encoding='utf-8') as f:
+                    f.write(fingerprint)
+            req_ok &= ok
     else:
         print("❌ requirements.txt introuvable")
         req_ok = False
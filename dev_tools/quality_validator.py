@@ -404,6 +404,33 @@ class QualityValidator:
                 results.append(("❌", "safe_execute", "Échec"))
         except Exception:
             results.append(("❌", "safe_execute", "Erreur"))
+        # Test nettoyage RX : noyau Numba et version Python identiques (si numba est installé)
+        try:
+            from core.terminal_clean_numba import clean_bytes
+            from core.main_window import _clean_rx_bytes
+        except ImportError:
+            results.append(("⚠️", "nettoyage RX", "Ignoré (numba, numpy ou PyQt5 absent)"))
+        else:
+            total += 1
+            try:
+                import random
+                rng = random.Random(0)
+                # Octets significatifs (ESC, '[', chiffres, ';', 'm', 'K', BS, DEL, '←', UTF-8)
+                alphabet = [0x1b, 0x5b, 0x30, 0x39, 0x3b, 0x6d, 0x4b, 0x08, 0x7f,
+                            0xe2, 0x86, 0x90, 0xc3, 0x41]
+                mismatches = 0
+                for _ in range(20000):
+                    data = bytes(rng.choice(alphabet) if rng.random() < 0.9 else rng.randrange(256)
+                                 for _ in range(rng.randrange(32)))
+                    if clean_bytes(data) != _clean_rx_bytes(data):
+                        mismatches += 1
+                if mismatches == 0:
+                    results.append(("✅", "nettoyage RX", "Numba et Python identiques (20000 entrées)"))
+                    ok += 1
+                else:
+                    results.append(("❌", "nettoyage RX", f"{mismatches} différences Numba/Python"))
+            except Exception:
+                results.append(("❌", "nettoyage RX", "Erreur"))
         # Affichage formaté
         for status, label, msg in results:
             print(f"{status} {label.ljust(20)} : {msg}")
@@ -37,10 +37,16 @@ from __future__ import annotations
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox, 
                             QLabel, QComboBox, QPushButton, QCheckBox, QLineEdit, QSpinBox,
                             QColorDialog, QFontDialog, QFileDialog)
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QFont, QColor
 from typing import List, Dict, Optional, Union
+import glob
+import json
 import logging
+import os
+import sys
+
+import serial.tools.list_ports
 
 logger = logging.getLogger("CrazySerialTerm")
 
@@ -180,7 +186,7 @@ class CustomizationPanel(QWidget):
             
             self.setLayout(layout)
         except Exception as e:
-            logger.error(f"Erreur lors de l'initialisation de l'UI: {e}")
+            logger.error("Erreur lors de l'initialisation de l'UI: %s", e)
             raise
     
     def connectSignals(self) -> None:
@@ -230,7 +236,7 @@ class CustomizationPanel(QWidget):
                 self.font_size.setValue(font.pointSize())
                 self.font_changed.emit(font)
         except Exception as e:
-            logger.error(f"Erreur lors du choix de la police : {e}")
+            logger.error("Erreur lors du choix de la police : %s", e)
 
     def choose_color(self, color_type: str) -> None:
         """
@@ -264,7 +270,7 @@ class CustomizationPanel(QWidget):
                     self.sent_color_btn.setStyleSheet(f"background-color: {color.name()}")
                 self.emit_colors_changed()
         except Exception as e:
-            logger.error(f"Erreur lors du choix de la couleur : {e}")
+            logger.error("Erreur lors du choix de la couleur : %s", e)
 
     def emit_colors_changed(self) -> None:
         """
@@ -310,6 +316,52 @@ class CustomizationPanel(QWidget):
         self.apply_settings()
         logger.info("Paramètres de personnalisation remis par défaut")
 
+def _scan_serial_ports() -> List[str]:
+    """
+    Énumère les ports série disponibles (cross-platform).
+    Returns:
+        List[str]: Noms des ports détectés.
+    """
+    if sys.platform.startswith('win'):
+        return [port.device for port in serial.tools.list_ports.comports()]
+    if sys.platform.startswith('linux') or sys.platform.startswith('cygwin'):
+        return glob.glob('/dev/tty[A-Za-z]*')
+    if sys.platform.startswith('darwin'):
+        return glob.glob('/dev/tty.*')
+    return []
+
+class _PortScanSignals(QObject):
+    """
+    Signal de fin du scan des ports (un QRunnable ne peut pas émettre lui-même).
+    """
+    finished = pyqtSignal(list)
+
+class _PortScanTask(QRunnable):
+    """
+    Scan des ports série exécuté dans le QThreadPool global, hors du thread GUI
+    (comports() peut bloquer plusieurs dizaines de ms sous Windows).
+    """
+
+    def __init__(self, signals: _PortScanSignals) -> None:
+        """
+        Initialise la tâche.
+        Args:
+            signals (_PortScanSignals): Objet (thread GUI) émettant le résultat.
+        """
+        super().__init__()
+        self.signals = signals
+
+    def run(self) -> None:
+        """
+        Énumère les ports et transmet la liste au thread GUI.
+        """
+        try:
+            ports = _scan_serial_ports()
+        except Exception as e:
+            logger.error("Erreur lors du scan des ports série : %s", e)
+            ports = []
+        self.signals.finished.emit(ports)
+
 class ConnectionPanel(QGroupBox):
     """
     Panneau de configuration de connexion série classique.
@@ -331,8 +383,16 @@ class ConnectionPanel(QGroupBox):
         Initialise le panneau de connexion série.
         """
         super().__init__("Paramètres de connexion")
+        # Scan des ports en arrière-plan : un seul à la fois, liste affichée mémorisée
+        self._ports: List[str] = []
+        self._port_scan_running = False
+        self._port_scan_signals = _PortScanSignals(self)
+        self._port_scan_signals.finished.connect(self._on_ports_scanned)
         self.setupUI()
         self.connectSignals()
+        # Premier scan lancé dès la création : la liste est remplie sans attendre
+        # le premier tick (5 s) du timer de ports de la fenêtre principale
+        self.refresh_ports()
     
     def setupUI(self) -> None:
         """
@@ -409,6 +469,7 @@ class ConnectionPanel(QGroupBox):
         Args:
             ports (List[str]): Liste des ports série détectés.
         """
+        self._ports = list(ports)
         current_port = self.port_select.currentText()
         self.port_select.clear()
         if ports:
@@ -430,25 +491,23 @@ class ConnectionPanel(QGroupBox):
     def refresh_ports(self) -> None:
         """
         Rafraîchit la liste des ports série disponibles (cross-platform, robuste et performant).
+        Le scan s'exécute dans le QThreadPool global ; la liste est mise à jour à son retour.
         """
-        try:
-            import sys
-            if sys.platform.startswith('win'):
-                import serial.tools.list_ports
-                ports = [port.device for port in serial.tools.list_ports.comports()]
-            elif sys.platform.startswith('linux') or sys.platform.startswith('cygwin'):
-                import glob
-                ports = glob.glob('/dev/tty[A-Za-z]*')
-            elif sys.platform.startswith('darwin'):
-                import glob
-                ports = glob.glob('/dev/tty.*')
-            else:
-                ports = []
+        if self._port_scan_running:
+            return
+        self._port_scan_running = True
+        QThreadPool.globalInstance().start(_PortScanTask(self._port_scan_signals))
+
+    def _on_ports_scanned(self, ports: List[str]) -> None:
+        """
+        Reçoit le résultat du scan (thread GUI) et ne touche au combo que si la liste a changé.
+        Args:
+            ports (List[str]): Ports série détectés.
+        """
+        self._port_scan_running = False
+        logger.debug("Ports série détectés : %s", ports)
+        if ports != self._ports:
             self.update_ports(ports)
-            logger.info(f"Ports série détectés : {ports}")
-        except Exception as e:
-            logger.error(f"Erreur lors du scan des ports série : {e}")
-            self.update_ports([])
 
 class InputPanel(QGroupBox):
     """
@@ -503,7 +562,7 @@ class InputPanel(QGroupBox):
             if text:
                 self.send_requested.emit(text)
         except Exception as e:
-            logger.error(f"Erreur lors de l'envoi de la commande : {e}")
+            logger.error("Erreur lors de l'envoi de la commande : %s", e)
     
     def clear_input(self) -> None:
         """
@@ -846,8 +905,6 @@ class AdvancedSettingsPanel(QWidget):
         Sauvegarde les paramètres actuels dans le fichier centralisé config/settings.json.
         """
         try:
-            import json
-            import os
             config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'settings.json')
             config_path = os.path.normpath(config_path)
             settings = {
@@ -866,15 +923,13 @@ class AdvancedSettingsPanel(QWidget):
                 json.dump(all_settings, f, indent=2)
             logger.info("Paramètres avancés sauvegardés dans config/settings.json")
         except Exception as e:
-            logger.error(f"Erreur lors de la sauvegarde des paramètres avancés: {e}")
+            logger.error("Erreur lors de la sauvegarde des paramètres avancés: %s", e)
 
     def load_settings(self) -> None:
         """
         Charge les paramètres avancés depuis le fichier centralisé config/settings.json.
         """
         try:
-            import json
-            import os
             config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'settings.json')
             config_path = os.path.normpath(config_path)
             with open(config_path, 'r', encoding='utf-8') as f:
@@ -921,7 +976,7 @@ class AdvancedSettingsPanel(QWidget):
         except FileNotFoundError:
             logger.info("Aucun fichier de paramètres trouvé")
         except Exception as e:
-            logger.error(f"Erreur lors du chargement des paramètres: {e}")
+            logger.error("Erreur lors du chargement des paramètres: %s", e)
     
     def reset_settings(self) -> None:
         """
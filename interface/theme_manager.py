@@ -31,7 +31,7 @@ Auteur :
 
 from __future__ import annotations
 
-from PyQt5.QtWidgets import QApplication, QTextEdit
+from PyQt5.QtWidgets import QApplication, QPlainTextEdit
 from PyQt5.QtGui import QColor, QPalette
 import logging
 from typing import Dict, Optional, List, Any
@@ -100,7 +100,7 @@ def apply_theme(theme_name: str) -> None:
     if not app:
         logger.error("Aucune application QApplication active")
         return
-    logger.info(f"Application du thème: {theme_name}")
+    logger.info("Application du thème: %s", theme_name)
     if theme_name == 'clair':
         app.setPalette(get_light_palette())
     elif theme_name == 'sombre':
@@ -108,7 +108,7 @@ def apply_theme(theme_name: str) -> None:
     elif theme_name == 'hacker':
         app.setPalette(get_hacker_palette())
     else:
-        logger.warning(f"Thème inconnu: {theme_name}")
+        logger.warning("Thème inconnu: %s", theme_name)
 
 def get_theme_terminal_colors(theme_name: str) -> Dict[str, QColor]:
     """
@@ -163,7 +163,7 @@ def reset_to_default_theme() -> None:
             app.setPalette(get_dark_palette())
             logger.info("Thème réinitialisé au thème sombre par défaut")
     except Exception as e:
-        logger.error(f"Erreur lors de la réinitialisation du thème: {e}")
+        logger.error("Erreur lors de la réinitialisation du thème: %s", e)
 
 # --- Classe ThemeManager ---
 class ThemeManager:
@@ -171,11 +171,18 @@ class ThemeManager:
     Gestionnaire de thèmes pour l'application CrazyTerm.
     Permet d'appliquer et de gérer les thèmes de l'interface.
     """
-    def __init__(self, terminal_output: Optional[QTextEdit] = None) -> None:
+    # Feuilles de style du terminal, construites une seule fois par thème
+    _THEME_STYLESHEETS: Dict[str, str] = {
+        'clair': "background-color: white; color: black;",
+        'sombre': "background-color: rgb(42, 42, 42); color: white;",
+        'hacker': "background-color: black; color: rgb(0, 255, 0);",
+    }
+
+    def __init__(self, terminal_output: Optional[QPlainTextEdit] = None) -> None:
         """
         Initialise le ThemeManager.
         Args:
-            terminal_output (QTextEdit, optionnel): Widget de sortie du terminal.
+            terminal_output (QPlainTextEdit, optionnel): Widget de sortie du terminal.
         """
         self.terminal_output = terminal_output
         logger.info("ThemeManager initialisé")
@@ -190,31 +197,24 @@ class ThemeManager:
             apply_theme(theme_name)
             if self.terminal_output and hasattr(self.terminal_output, 'terminal_buffer'):
                 self.terminal_output.terminal_buffer.set_theme(theme_name)
-                logger.info(f"Thème appliqué au terminal: {theme_name}")
+                logger.info("Thème appliqué au terminal: %s", theme_name)
         except Exception as e:
-            logger.error(f"Erreur lors de l'application du thème: {e}")
+            logger.error("Erreur lors de l'application du thème: %s", e)
             raise
 
     def refresh_terminal_display(self, theme_name: str) -> None:
         """
-        Réapplique la couleur du thème courant à tout le texte du terminal.
-        Utilise la même approche que l'ancien CrazySerialTerm avec les palettes + setStyleSheet.
+        Applique au widget du terminal la feuille de style (fond et couleur de texte) du thème.
+        Seule la feuille de style du terminal est changée : la palette globale est
+        déjà posée par apply_theme et le document n'est ni vidé ni remis en page.
         """
         if not self.terminal_output:
             return
-        app = QApplication.instance()
-        if app:
-            if theme_name == 'clair':
-                app.setPalette(get_light_palette())
-                self.terminal_output.setStyleSheet("background-color: white; color: black;")
-            elif theme_name == 'sombre':
-                app.setPalette(get_dark_palette())
-                self.terminal_output.setStyleSheet("background-color: rgb(42, 42, 42); color: white;")
-            elif theme_name == 'hacker':
-                app.setPalette(get_hacker_palette())
-                self.terminal_output.setStyleSheet("background-color: black; color: rgb(0, 255, 0);")
-        self.terminal_output.update()
-        logger.info(f"Affichage du terminal rafraîchi pour le thème : {theme_name}")
+        stylesheet = self._THEME_STYLESHEETS.get(theme_name)
+        if stylesheet is not None:
+            # setStyleSheet repolit le widget et planifie lui-même son repaint
+            self.terminal_output.setStyleSheet(stylesheet)
+        logger.info("Affichage du terminal rafraîchi pour le thème : %s", theme_name)
 
     def save_custom_theme(self, theme_name: str, theme_data: Dict[str, Any]) -> None:
         """
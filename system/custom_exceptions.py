@@ -75,7 +75,7 @@ def get_exception_class(name: str) -> Type[CrazySerialTermException]:
         }
         return mapping[name]
     except KeyError as e:
-        logger.error(f"Nom d'exception inconnu: {name}")
+        logger.error("Nom d'exception inconnu: %s", name)
         raise
 
 SerialPortException: Type[SerialConnectionError] = SerialConnectionError
@@ -90,9 +90,9 @@ def retry_with_backoff(
                 except exceptions as e:
                     last_exception = e
                     if attempt == max_retries:
-                        logger.error(f"Échec définitif de {func.__name__} après {max_retries} tentatives: {e}")
+                        logger.error("Échec définitif de %s après %s tentatives: %s", func.__name__, max_retries, e)
                         raise
-                    logger.warning(f"Tentative {attempt + 1}/{max_retries + 1} échouée pour {func.__name__}: {e}")
+                    logger.warning("Tentative %s/%s échouée pour %s: %s", attempt + 1, max_retries + 1, func.__name__, e)
                     time.sleep(min(delay, max_delay))
                     delay *= backoff_factor
             if last_exception:
@@ -115,7 +115,7 @@ def safe_execute(func: Callable[[], Any], default_value: Any = None, log_errors:
         return func()
     except Exception as e:
         if log_errors:
-            logger.error(f"Erreur lors de l'exécution de {func.__name__}: {e}")
+            logger.error("Erreur lors de l'exécution de %s: %s", func.__name__, e)
         return default_value
 
 class CircuitBreaker:
@@ -198,7 +198,7 @@ class CircuitBreaker:
         self.last_failure_time = time.time()
         if self.failure_count >= self.failure_threshold:
             self.state = 'OPEN'
-            logger.warning(f"Circuit breaker ouvert après {self.failure_count} échecs")
+            logger.warning("Circuit breaker ouvert après %s échecs", self.failure_count)
 
 class ResourceGuard:
     """
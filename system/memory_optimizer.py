@@ -37,9 +37,9 @@ import gc
 import weakref
 import threading
 from typing import Dict, List, Optional, Set, Any, Callable
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
 from PyQt5.QtGui import QTextCursor, QTextCharFormat, QColor
-from PyQt5.QtWidgets import QTextEdit
+from PyQt5.QtWidgets import QPlainTextEdit
 import logging
 
 # Initialize logger
@@ -114,12 +114,24 @@ class UltraMemoryManager(QObject):
             self._peak_object_count: int = 0
             self._cleanup_counter: int = 0
             self._cleanup_timer: QTimer = QTimer()
+            # Periodic housekeeping: second-level accuracy is enough
+            self._cleanup_timer.setTimerType(Qt.VeryCoarseTimer)
             self._cleanup_timer.timeout.connect(self._aggressive_cleanup)
             self._cleanup_timer.start(5000)
             self._tracked_objects: Set[weakref.ref] = set()
             logger.info("UltraMemoryManager initialized")
         except Exception as e:
-            logger.error(f"Error initializing UltraMemoryManager: {e}")
+            logger.error("Error initializing UltraMemoryManager: %s", e)
+
+    @property
+    def object_count(self) -> int:
+        """
+        Number of currently tracked objects, without building the full statistics dict.
+
+        Returns:
+            int: Current object count.
+        """
+        return self._object_count
 
     def get_cached_format(self, color: str, bold: bool = False) -> QTextCharFormat:
         """
@@ -142,12 +154,12 @@ class UltraMemoryManager(QObject):
             self._object_count += 1
         return self._format_cache[cache_key]
 
-    def get_cursor(self, text_edit: QTextEdit) -> QTextCursor:
+    def get_cursor(self, text_edit: QPlainTextEdit) -> QTextCursor:
         """
         Retrieve a cursor from the pool.
 
         Args:
-            text_edit (QTextEdit): Target widget.
+            text_edit (QPlainTextEdit): Target widget.
 
         Returns:
             QTextCursor: PyQt cursor.
@@ -179,12 +191,12 @@ class UltraMemoryManager(QObject):
             self._text_buffer.append(text)
             return len(self._text_buffer) >= self._max_buffer_size
 
-    def flush_buffer(self, text_edit: QTextEdit) -> None:
+    def flush_buffer(self, text_edit: QPlainTextEdit) -> None:
         """
         Flush the buffer to the terminal with memory optimization.
 
         Args:
-            text_edit (QTextEdit): Target widget.
+            text_edit (QPlainTextEdit): Target widget.
         """
         with self._buffer_lock:
             if not self._text_buffer:
@@ -229,22 +241,20 @@ class UltraMemoryManager(QObject):
                 for key in keys[:-3]:
                     fmt = self._format_cache.pop(key)
                     self._format_pool.release(fmt)
-            dead_refs = {ref for ref in self._tracked_objects if ref() is None}
-            self._tracked_objects -= dead_refs
-            if self._cleanup_counter % 3 == 0:
-                collected: int = gc.collect()
-                if collected > 0:
-                    logger.debug(f"GC collected: {collected} objects")
+            # No dead-reference scan: the weakref callback of track_object already
+            # removes each reference from _tracked_objects when its object dies
+            # No periodic gc.collect(): a full collection stalls the GUI thread and the
+            # generational GC (tuned at startup) already handles the few cycles created
             if self._object_count > 40:
                 self.memory_warning.emit(self._object_count)
                 self._immediate_cleanup()
         except Exception as e:
-            logger.error(f"Error during aggressive cleanup: {e}")
+            logger.error("Error during aggressive cleanup: %s", e)
 
     def _immediate_cleanup(self) -> None:
         """Immediate and aggressive cleanup."""
         try:
-            logger.warning(f"Immediate cleanup: {self._object_count} objects")
+            logger.warning("Immediate cleanup: %s objects", self._object_count)
             for fmt in self._format_cache.values():
                 self._format_pool.release(fmt)
             self._format_cache.clear()
@@ -252,7 +262,7 @@ class UltraMemoryManager(QObject):
                 gc.collect()
             self._object_count = max(0, self._object_count - 20)
         except Exception as e:
-            logger.error(f"Error during immediate cleanup: {e}")
+            logger.error("Error during immediate cleanup: %s", e)
 
     def get_memory_stats(self) -> Dict[str, int]:
         """
@@ -284,7 +294,7 @@ class UltraMemoryManager(QObject):
                 gc.collect()
             logger.info("Emergency cleanup completed")
         except Exception as e:
-            logger.error(f"Error during emergency cleanup: {e}")
+            logger.error("Error during emergency cleanup: %s", e)
 
 # Global instance
 _ultra_memory_manager: Optional[UltraMemoryManager] = None
@@ -305,7 +315,7 @@ def get_ultra_memory_manager() -> UltraMemoryManager:
             _ultra_memory_manager = UltraMemoryManager()
         return _ultra_memory_manager
     except Exception as e:
-        logger.error(f"Error creating global UltraMemoryManager instance: {e}")
+        logger.error("Error creating global UltraMemoryManager instance: %s", e)
         raise
 
 __all__ = []
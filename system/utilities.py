@@ -31,6 +31,7 @@ from __future__ import annotations
 
 import sys
 import os
+import json
 import logging
 from typing import Any
 
@@ -63,12 +64,12 @@ class UtilityFunctions:
                 # Remonter au dossier racine (depuis system/ vers la racine)
                 base_path = os.path.dirname(current_dir)
             except Exception as err:
-                logger.error(f"Erreur lors de la résolution du chemin de ressource: {err}")
+                logger.error("Erreur lors de la résolution du chemin de ressource: %s", err)
                 raise
         try:
             return os.path.join(base_path, relative_path)
         except Exception as e:
-            logger.error(f"Erreur lors de la construction du chemin: {e}")
+            logger.error("Erreur lors de la construction du chemin: %s", e)
             raise
 
     @staticmethod
@@ -83,7 +84,6 @@ class UtilityFunctions:
             FileNotFoundError: Si le fichier n'existe pas
             ValueError: Si le JSON est invalide
         """
-        import json
         config_path = UtilityFunctions.resource_path('config/settings.json')
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Fichier de configuration introuvable: {config_path}")
@@ -91,7 +91,7 @@ class UtilityFunctions:
             try:
                 return json.load(f)
             except Exception as e:
-                logger.error(f"Erreur lors du chargement du fichier de configuration: {e}")
+                logger.error("Erreur lors du chargement du fichier de configuration: %s", e)
                 raise ValueError(f"Erreur de parsing JSON: {e}")
 
 __all__ = []
@@ -35,8 +35,12 @@ from PyQt5.QtWidgets import QDialog, QVBoxLayout, QGridLayout, QPushButton, QLin
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QKeyEvent
 import math
+import re
 from typing import Optional, Any
 
+# Opérateur pourcentage a%b (compilé une fois)
+_PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)%([\d(])')
+
 class ToolCalculator(QDialog):
     def __init__(self, parent: Optional[Any] = None) -> None:
         super().__init__(parent)
@@ -116,7 +120,9 @@ class ToolCalculator(QDialog):
 
     def _replace_percent(self, expr: str) -> str:
         # Remplace a%b par (a/100*b) si % est utilisé comme opérateur
-        import re
-        return re.sub(r'(\d+(?:\.\d+)?)%([\d(])', r'(\1/100*\2)', expr)
+        return _PERCENT_RE.sub(r'(\1/100*\2)', expr)
+
+# Classe instanciée par le ToolManager (évite la recherche par dir())
+TOOL_CLASS = ToolCalculator
 
 __all__ = ["ToolCalculator"]
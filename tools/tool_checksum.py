@@ -36,7 +36,6 @@ import logging
 from typing import Optional, Dict
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, 
                              QTextEdit, QLineEdit, QPushButton, QGroupBox, QGridLayout)
-from PyQt5.QtCore import Qt
 
 logger = logging.getLogger("CrazySerialTerm.ToolChecksum")
 
@@ -191,7 +190,7 @@ class ChecksumCalculator(QDialog):
 
             logger.info("Checksums calculés avec succès.")
         except Exception as e:
-            logger.error(f"Erreur lors du calcul des checksums: {e}")
+            logger.error("Erreur lors du calcul des checksums: %s", e)
             raise
 
     def clearData(self) -> None:
@@ -218,4 +217,7 @@ class ChecksumCalculator(QDialog):
             self.results[key].clear()
         logger.debug("Résultats effacés.")
 
+# Classe instanciée par le ToolManager (évite la recherche par dir())
+TOOL_CLASS = ChecksumCalculator
+
 __all__ = []
\ No newline at end of file
@@ -31,7 +31,7 @@ Auteur :
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional, List
+from typing import Optional
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLineEdit, QPushButton, QLabel,
     QHBoxLayout, QMessageBox, QComboBox, QApplication
@@ -127,7 +127,7 @@ class ToolConverter(QWidget):
                 logger.error("Aucune instance QApplication active pour le presse-papiers.")
                 QMessageBox.warning(self, "Erreur", "Impossible d'accéder au presse-papiers (QApplication manquant)")
         except Exception as e:
-            logger.error(f"Erreur lors de la copie de la sortie : {e}")
+            logger.error("Erreur lors de la copie de la sortie : %s", e)
             QMessageBox.warning(self, "Erreur", f"Impossible de copier la sortie : {e}")
 
     def pasteInput(self) -> None:
@@ -138,7 +138,7 @@ class ToolConverter(QWidget):
             self.input_edit.paste()
             logger.info("Entrée collée depuis le presse-papiers")
         except Exception as e:
-            logger.error(f"Erreur lors du collage de l'entrée : {e}")
+            logger.error("Erreur lors du collage de l'entrée : %s", e)
             QMessageBox.warning(self, "Erreur", f"Impossible de coller l'entrée : {e}")
 
     def convert(self) -> None:
@@ -204,13 +204,16 @@ class ToolConverter(QWidget):
             self.hex_edit.setText(hex_val)
             self.bin_edit.setText(bin_val)
             self.ascii_edit.setText(ascii_val)
-            logger.info(f"Conversion effectuée : {value} -> dec:{dec_val} hex:{hex_val} bin:{bin_val} ascii:{ascii_val}")
+            logger.info("Conversion effectuée : %s -> dec:%s hex:%s bin:%s ascii:%s", value, dec_val, hex_val, bin_val, ascii_val)
         except Exception as e:
-            logger.error(f"Erreur lors de la conversion : {e}")
+            logger.error("Erreur lors de la conversion : %s", e)
             QMessageBox.warning(self, "Erreur de conversion", f"Entrée invalide ou hors plage : {e}")
 
     def show(self) -> None:
         """Affiche la fenêtre du convertisseur de données."""
         super().show()
         self.raise_()
-        self.activateWindow()
\ No newline at end of file
+        self.activateWindow()
+
+# Classe instanciée par le ToolManager (évite la recherche par dir())
+TOOL_CLASS = ToolConverter